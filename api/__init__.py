@@ -6,22 +6,18 @@ focused on application setup and HTML views.
 
 from __future__ import annotations
 
-from flask import Blueprint, jsonify, request, current_app, url_for
+from flask import Blueprint, jsonify, request, current_app
 from flask_login import current_user, login_required
 from flask_babel import _
-from langdetect import detect, LangDetectException
 from search_utils import expand_with_synonyms
 
 from models import (
     db,
     Post,
-    Tag,
     PostMetadata,
     Revision,
     PostCitation,
     UserPostCitation,
-    PostWatch,
-    Notification,
 )
 
 
@@ -31,26 +27,22 @@ api_bp = Blueprint("api", __name__, url_prefix="/api")
 @api_bp.route("/posts", methods=["GET"])
 def search_posts():
     """Search posts with optional full-text query and pagination."""
-    from sqlalchemy import text
+    from app import fts_post_ids
 
     q = (request.args.get("q") or "").strip()
-    limit = request.args.get("limit", type=int)
+    limit = request.args.get("limit", type=int, default=20)
     offset = request.args.get("offset", type=int, default=0)
 
     query = Post.query
     if q:
         expanded_q = expand_with_synonyms(q)
-        ids = [
-            row[0]
-            for row in db.session.execute(
-                text("SELECT rowid FROM post_fts WHERE post_fts MATCH :q"),
-                {"q": expanded_q},
-            )
-        ]
-        query = query.filter(Post.id.in_(ids)) if ids else query.filter(False)
+        query = query.filter(Post.id.in_(fts_post_ids(expanded_q)))
 
     total = query.count()
-    query = query.order_by(Post.id.desc())
+    # Only the listed columns are needed; skip loading post bodies.
+    query = query.with_entities(
+        Post.id, Post.path, Post.language, Post.title
+    ).order_by(Post.id.desc())
     if offset:
         query = query.offset(offset)
     if limit and limit > 0:
@@ -69,7 +61,14 @@ def search_posts():
 @login_required
 def create_post():
     """Create a new post via the API."""
-    from app import geocode_address, generate_unique_path, update_post_links
+    from app import (
+        detect_post_language,
+        geocode_address,
+        generate_unique_path,
+        get_or_create_tags,
+        path_taken,
+        update_post_links,
+    )
 
     if not current_user.can_edit_posts():
         return jsonify({"error": "forbidden"}), 403
@@ -100,13 +99,8 @@ def create_post():
     if not title or not body:
         return jsonify({"error": "title and body required"}), 400
     if language not in current_app.config["LANGUAGES"]:
-        try:
-            language = detect(body)
-        except LangDetectException:
-            language = current_app.config["BABEL_DEFAULT_LOCALE"]
-        if language not in current_app.config["LANGUAGES"]:
-            language = current_app.config["BABEL_DEFAULT_LOCALE"]
-    if not path or Post.query.filter_by(path=path, language=language).first():
+        language = detect_post_language(body)
+    if not path or path_taken(path, language):
         path = generate_unique_path(title, language)
     tags_input = data.get("tags", [])
     if isinstance(tags_input, str):
@@ -115,13 +109,7 @@ def create_post():
         tag_names = [
             t.strip() for t in tags_input if isinstance(t, str) and t.strip()
         ]
-    tags = []
-    for name in dict.fromkeys(tag_names):
-        tag = Tag.query.filter_by(name=name).first()
-        if not tag:
-            tag = Tag(name=name)
-            db.session.add(tag)
-        tags.append(tag)
+    tags = get_or_create_tags(tag_names)
     post = Post(
         title=title,
         body=body,
@@ -185,7 +173,12 @@ def get_post(post_id: int):
 @login_required
 def update_post(post_id: int):
     """Update a post's content and metadata."""
-    from app import generate_unique_path, update_post_links
+    from app import (
+        generate_unique_path,
+        path_taken,
+        replace_post_metadata,
+        update_post_links,
+    )
 
     post = Post.query.get_or_404(post_id)
     if not current_user.can_edit_posts():
@@ -203,12 +196,7 @@ def update_post(post_id: int):
     if not title or not body:
         return jsonify({"error": "title and body required"}), 400
 
-    existing = (
-        Post.query.filter_by(path=path, language=language)
-        .filter(Post.id != post.id)
-        .first()
-    )
-    if existing:
+    if path_taken(path, language, exclude_id=post.id):
         return jsonify({"error": "path already exists"}), 400
 
     old_body = post.body
@@ -230,16 +218,12 @@ def update_post(post_id: int):
 
     meta = data.get("metadata")
     if isinstance(meta, dict):
-        current_views = PostMetadata.query.filter_by(post_id=post.id, key="views").first()
-        PostMetadata.query.filter(
-            PostMetadata.post_id == post.id, PostMetadata.key != "views"
-        ).delete(synchronize_session=False)
-        for key, value in meta.items():
-            if key in {"lat", "lon"}:
-                value = str(value)
-            db.session.add(PostMetadata(post=post, key=key, value=value))
-        if current_views:
-            db.session.add(current_views)
+        meta = {
+            key: str(value) if key in {"lat", "lon"} else value
+            for key, value in meta.items()
+            if key != "views"
+        }
+        replace_post_metadata(post, meta)
         lat_val = meta.get("lat")
         lon_val = meta.get("lon")
         if lat_val is not None and lon_val is not None:
@@ -267,7 +251,7 @@ def update_post(post_id: int):
 @api_bp.route("/posts/<int:post_id>/citation", methods=["POST"])
 @login_required
 def add_url_citation(post_id: int):
-    from app import is_url
+    from app import citation_exists, is_url, notify_watchers
 
     post = Post.query.get_or_404(post_id)
     if not request.is_json:
@@ -277,14 +261,7 @@ def add_url_citation(post_id: int):
     context = (data.get("context") or "").strip()
     if not url or not is_url(url):
         return jsonify({"error": "valid URL required"}), 400
-    existing = PostCitation.query.filter_by(
-        post_id=post.id, citation_text=url
-    ).first()
-    if not existing:
-        existing = UserPostCitation.query.filter_by(
-            post_id=post.id, citation_text=url
-        ).first()
-    if existing:
+    if citation_exists(post.id, text=url):
         return jsonify({"error": "Citation with this URL already exists."}), 400
     entry = {"url": url}
     if current_user.id == post.author_id or current_user.is_admin():
@@ -310,15 +287,7 @@ def add_url_citation(post_id: int):
             bibtex_fields=entry,
         )
     db.session.add(citation)
-    watcher_ids = {
-        w.user_id for w in PostWatch.query.filter_by(post_id=post.id).all()
-    }
-    watcher_ids.add(post.author_id)
-    link = url_for("post_detail", post_id=post.id)
-    for uid in watcher_ids:
-        if uid != current_user.id:
-            msg = _("Citation added to \"%(title)s\".", title=post.title)
-            db.session.add(Notification(user_id=uid, message=msg, link=link))
+    notify_watchers(post, _("Citation added to \"%(title)s\".", title=post.title))
     db.session.commit()
     return jsonify({"id": citation.id, "url": url}), 201
 
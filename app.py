@@ -1,7 +1,15 @@
 import difflib
+import hashlib
+import heapq
+import http.cookiejar
 import json
 import os
 import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from html.parser import HTMLParser
 import markdown
 import math
 from datetime import datetime, timezone, timedelta
@@ -20,6 +28,8 @@ from flask import (
     Response,
     session,
     current_app,
+    g,
+    stream_with_context,
 )
 from flask_login import (
     LoginManager,
@@ -37,16 +47,43 @@ from markupsafe import Markup, escape
 import requests
 from habanero import Crossref
 import bibtexparser
+import click
 from types import SimpleNamespace
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
+from itertools import chain
 import nltk
 from nltk.corpus import wordnet as wn
-from sqlalchemy import func, event, or_, text, inspect, select
+from sqlalchemy import (
+    case,
+    bindparam,
+    column,
+    func,
+    event,
+    or_,
+    text,
+    delete,
+    inspect,
+    insert,
+    select,
+    literal,
+    table,
+    type_coerce,
+    union,
+    union_all,
+    Integer,
+    String,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import NoSuchTableError
-from flask_babel import Babel, _, get_locale
+from sqlalchemy.orm import defer, joinedload, load_only, selectinload
+from sqlalchemy.schema import CreateIndex
+from flask.json.provider import DefaultJSONProvider
+from flask_babel import Babel, _, get_locale, lazy_gettext
 from dotenv import load_dotenv
+from geopy.extra.rate_limiter import RateLimiter
 from geopy.geocoders import Nominatim
-from geopy.distance import distance as geopy_distance
 from langdetect import detect, DetectorFactory, LangDetectException
 import zoneinfo
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -56,6 +93,7 @@ from keyword_highlight_plugin import apply_keyword_highlight_plugin
 from models import (
     db,
     POST_EDITOR_ROLES,
+    POST_FTS_CREATE_SQL,
     User,
     Post,
     Tag,
@@ -83,6 +121,8 @@ app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv(
     'SQLALCHEMY_DATABASE_URI', 'sqlite:///wiki.db'
 )
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Larger compiled statement cache for the many distinct ORM queries per page
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {'query_cache_size': 1200}
 app.config['BABEL_DEFAULT_LOCALE'] = os.getenv('BABEL_DEFAULT_LOCALE', 'en')
 app.config['BABEL_DEFAULT_TIMEZONE'] = os.getenv('BABEL_DEFAULT_TIMEZONE', 'UTC')
 app.config['LANGUAGES'] = [
@@ -97,12 +137,55 @@ app.config['MAX_CONTENT_LENGTH'] = None
 app.config['MAX_FORM_MEMORY_SIZE'] = None
 
 db.init_app(app)
+
+# Applied to every new SQLite connection: WAL lets readers proceed while a
+# writer commits, and NORMAL sync is durable under WAL with fewer fsyncs.
+SQLITE_PRAGMAS = (
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'cache_size=-64000',
+    'mmap_size=268435456',
+    'temp_store=MEMORY',
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f'PRAGMA {pragma}')
+    finally:
+        cursor.close()
+
+
+# Only this app's engine is configured; other engines in the process keep
+# their own settings.
+with app.app_context():
+    event.listen(db.engine, 'connect', _set_sqlite_pragmas)
+
+
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
 
 socketio = SocketIO(app)
 cr = Crossref()
 
+HTTP_POOL_SIZE = 16
+
+# Shared session for outbound fetches (Crossref BibTeX, Open Graph) so
+# repeated requests to the same host reuse pooled keep-alive connections
+# instead of paying a fresh TCP/TLS handshake each time. Cookies are refused
+# so one fetched site cannot set state that is sent on later fetches.
+http_session = requests.Session()
+http_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_http_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+)
+http_session.mount('http://', _http_adapter)
+http_session.mount('https://', _http_adapter)
+
 from api import api_bp
 
 app.register_blueprint(api_bp)
@@ -123,6 +206,16 @@ STOPWORDS = {
 babel = Babel(app)
 
 geolocator = Nominatim(user_agent="spacetime_app")
+# Nominatim's usage policy allows one request per second per application, so
+# forward and reverse lookups share a single limiter. Lookups go through it
+# as ``_nominatim_rate_limit(geolocator.reverse, ...)``.
+NOMINATIM_MIN_DELAY = 1
+_nominatim_rate_limit = RateLimiter(
+    lambda call, *args: call(*args),
+    min_delay_seconds=NOMINATIM_MIN_DELAY,
+    max_retries=0,
+    swallow_exceptions=False,
+)
 
 try:
     import redis  # type: ignore
@@ -134,6 +227,71 @@ except Exception:
 
 GEOCODE_CACHE_TTL = int(os.getenv("GEOCODE_CACHE_TTL", 60 * 60 * 24))
 
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy ships with yake
+    np = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+def to_json(obj) -> str:
+    """Serialize ``obj`` compactly for embedding map data in pages.
+
+    Uses orjson when installed, which writes NaN and infinities as ``null``
+    so the result is always valid JSON. Integers wider than 64 bits, which
+    orjson rejects, fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def from_json(data: str):
+    """Parse ``data`` with orjson when installed, else the stdlib.
+
+    Both raise a :class:`json.JSONDecodeError` subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider encoding with orjson.
+
+    Keys are sorted as with the default provider, and values orjson does
+    not handle itself, including dates, go through the default provider's
+    ``default``. Output differs from the default provider in two ways: it is
+    always compact, and NaN and infinities become ``null`` instead of the
+    non-standard ``NaN``/``Infinity`` tokens. Integers wider than 64 bits are
+    encoded by the default provider.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        option = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
 
 def select_locale():
     if current_user.is_authenticated and current_user.locale:
@@ -282,10 +440,128 @@ def ensure_post_created_at_column() -> None:
 ensure_post_created_at_column()
 
 
+def ensure_tag_synonyms_column() -> None:
+    with app.app_context():
+        inspector = inspect(db.engine)
+        try:
+            cols = [c["name"] for c in inspector.get_columns("tag")]
+        except NoSuchTableError:
+            return
+        if "synonyms" not in cols:
+            with db.engine.begin() as conn:
+                conn.execute(text("ALTER TABLE tag ADD COLUMN synonyms TEXT"))
+
+
+ensure_tag_synonyms_column()
+
+
+def ensure_model_indexes() -> None:
+    """Create indexes declared on the models that an existing database lacks.
+
+    ``db.create_all`` skips tables that already exist, so indexes added to
+    the models later never reach older databases on their own. Unique
+    indexes are left out: rows written before them may already violate
+    them, which would stop the application from starting. ``IF NOT EXISTS``
+    is used rather than ``checkfirst`` because SQLite reflection does not
+    report expression indexes such as ``ix_tag_name_lower``.
+    """
+    with app.app_context():
+        inspector = inspect(db.engine)
+        with db.engine.begin() as conn:
+            for table in db.metadata.sorted_tables:
+                if not inspector.has_table(table.name):
+                    continue
+                for index in table.indexes:
+                    if not index.unique:
+                        conn.execute(CreateIndex(index, if_not_exists=True))
+
+
+ensure_model_indexes()
+
+
+def migrate_post_fts_columnsize() -> bool:
+    """Recreate ``post_fts`` without its ``docsize`` shadow table.
+
+    Databases created before ``columnsize=0`` still carry ``post_fts_docsize``;
+    the index is rebuilt from ``post`` since the content is external. Returns
+    whether the table was recreated.
+    """
+    with app.app_context():
+        if db.engine.dialect.name != "sqlite":
+            return False
+        inspector = inspect(db.engine)
+        if not inspector.has_table("post_fts_docsize"):
+            return False
+        with db.engine.begin() as conn:
+            conn.execute(text("DROP TABLE post_fts"))
+            # Without ``post`` there is nothing to rebuild from; the table is
+            # recreated by ``create_post_fts`` once ``post`` exists again.
+            if not inspector.has_table("post"):
+                return False
+            conn.execute(text(POST_FTS_CREATE_SQL))
+            conn.execute(text("INSERT INTO post_fts(post_fts) VALUES('rebuild')"))
+        return True
+
+
+@app.cli.command('migrate-post-fts')
+def migrate_post_fts_command() -> None:
+    """Rebuild the full-text index without per-row size data."""
+    if migrate_post_fts_columnsize():
+        click.echo('Rebuilt post_fts.')
+    else:
+        click.echo('post_fts is up to date.')
+
+
+def ensure_sqlite_statistics() -> None:
+    """Run ``ANALYZE`` once so the planner has ``sqlite_stat1`` to go by.
+
+    Later runs are left to the operator; re-analysing on every start would
+    scan every index of a large database.
+    """
+    with app.app_context():
+        if db.engine.dialect.name != "sqlite":
+            return
+        inspector = inspect(db.engine)
+        if not inspector.has_table("post") or inspector.has_table("sqlite_stat1"):
+            return
+        with db.engine.begin() as conn:
+            # Statistics taken before any content exists would only mislead.
+            if conn.execute(text("SELECT 1 FROM post LIMIT 1")).first() is None:
+                return
+            conn.execute(text("ANALYZE"))
+
+
+ensure_sqlite_statistics()
+
+
+BIBTEX_LOOKUP_MEMO_SIZE = 1024
+_bibtex_lookup_memo: OrderedDict[str, str] = OrderedDict()
+_bibtex_lookup_memo_lock = threading.Lock()
+
+
 def fetch_bibtex_by_title(title: str) -> str | None:
-    """Return raw BibTeX for the first work matching the given title."""
+    """Return raw BibTeX for the first work matching the given title.
+
+    Successful lookups are memoized in-process so repeated fetches of the
+    same title skip both CrossRef round trips; failures are retried.
+    """
     if not title:
         return None
+    with _bibtex_lookup_memo_lock:
+        bibtex = _bibtex_lookup_memo.get(title)
+        if bibtex is not None:
+            _bibtex_lookup_memo.move_to_end(title)
+            return bibtex
+    bibtex = _fetch_bibtex_remote(title)
+    if bibtex is not None:
+        with _bibtex_lookup_memo_lock:
+            _bibtex_lookup_memo[title] = bibtex
+            while len(_bibtex_lookup_memo) > BIBTEX_LOOKUP_MEMO_SIZE:
+                _bibtex_lookup_memo.popitem(last=False)
+    return bibtex
+
+
+def _fetch_bibtex_remote(title: str) -> str | None:
     try:
         result = cr.works(query_title=title, limit=1)
     except Exception:
@@ -298,7 +574,7 @@ def fetch_bibtex_by_title(title: str) -> str | None:
         return None
     url = f"https://api.crossref.org/works/{doi}/transform/application/x-bibtex"
     try:
-        resp = requests.get(url, timeout=10)
+        resp = http_session.get(url, timeout=10)
     except Exception:
         return None
     if resp.status_code != 200:
@@ -306,6 +582,25 @@ def fetch_bibtex_by_title(title: str) -> str | None:
     return resp.text.strip()
 
 
+_post_fts = table('post_fts', column('rowid'))
+# Built once so each search only rebinds the query string; the statement's
+# cache key never changes, so its compiled form is reused from the engine's
+# compiled cache.
+_FTS_IDS = select(_post_fts.c.rowid).where(
+    text('post_fts MATCH :fts_q').bindparams(bindparam('fts_q'))
+)
+
+
+def fts_post_ids(match: str):
+    """Return a subquery selecting ids of posts whose body matches ``match``.
+
+    Used as ``Post.id.in_(fts_post_ids(q))`` so the full-text lookup and the
+    post query run as one statement. Keep the ``MATCH`` inside this subquery:
+    SQLite then evaluates it through the FTS index first and probes ``post``
+    by rowid, whereas mixing it into the outer ``WHERE`` alongside other
+    column filters can make the planner scan ``post_fts`` instead.
+    """
+    return _FTS_IDS.params(fts_q=match)
 
 
 def suggest_citations(markdown_text: str) -> dict[str, list[dict]]:
@@ -335,14 +630,7 @@ def suggest_citations(markdown_text: str) -> dict[str, list[dict]]:
         sample_words = unique_words[:3]
         query = " OR ".join(sample_words)
 
-        ids = [
-            row[0]
-            for row in db.session.execute(
-                text('SELECT rowid FROM post_fts WHERE post_fts MATCH :q'),
-                {'q': query},
-            )
-        ]
-        posts_query = Post.query.filter(Post.id.in_(ids)) if ids else Post.query.filter(False)
+        posts_query = Post.query.filter(Post.id.in_(fts_post_ids(query)))
         if lang:
             posts_query = posts_query.filter(Post.language == lang)
         posts = posts_query.limit(3).all()
@@ -364,7 +652,7 @@ def fetch_open_graph(url: str) -> dict[str, str]:
     if not url:
         return {}
     try:
-        resp = requests.get(url, timeout=5)
+        resp = http_session.get(url, timeout=5)
     except Exception:
         return {}
     if resp.status_code != 200:
@@ -410,7 +698,7 @@ def geocode_address(address: str) -> tuple[float, float] | None:
         except Exception:
             pass
     try:
-        location = geolocator.geocode(address)
+        location = _nominatim_rate_limit(geolocator.geocode, address)
     except Exception:
         return None
     if not location:
@@ -426,12 +714,48 @@ def geocode_address(address: str) -> tuple[float, float] | None:
     return coords
 
 
+# In-process memo of successful reverse geocodes in front of ``geocode_cache``
+REVERSE_GEOCODE_MEMO_SIZE = 100_000
+# Coordinates are snapped to four decimals (about 11 m) before lookup so
+# nearby points share one cache cell.
+REVERSE_GEOCODE_PRECISION = 4
+_reverse_geocode_memo: OrderedDict[tuple[float, float], str] = OrderedDict()
+_reverse_geocode_memo_lock = threading.Lock()
+
+# Lookups for one page run in the background while the page is assembled.
+# One worker is enough since Nominatim is limited to a request per second.
+_geocode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='geocode')
+
+
 def reverse_geocode_coords(lat: float, lon: float) -> str | None:
     """Return human-readable address for coordinates using Nominatim.
 
-    Results are cached in ``geocode_cache`` keyed by ``"rev:lat,lon"``. Cache
-    failures are ignored so the reverse geocoding still proceeds normally.
+    Coordinates are rounded to ``REVERSE_GEOCODE_PRECISION`` decimals, then
+    results are memoized in-process and cached in ``geocode_cache`` keyed by
+    ``"rev:lat,lon"``. Cache failures are ignored so the reverse geocoding
+    still proceeds normally. Coordinates that are not numeric yield ``None``.
     """
+    try:
+        lat = round(float(lat), REVERSE_GEOCODE_PRECISION)
+        lon = round(float(lon), REVERSE_GEOCODE_PRECISION)
+    except (TypeError, ValueError):
+        return None
+    memo_key = (lat, lon)
+    with _reverse_geocode_memo_lock:
+        address = _reverse_geocode_memo.get(memo_key)
+        if address is not None:
+            _reverse_geocode_memo.move_to_end(memo_key)
+            return address
+    address = _reverse_geocode_remote(lat, lon)
+    if address is not None:
+        with _reverse_geocode_memo_lock:
+            _reverse_geocode_memo[memo_key] = address
+            while len(_reverse_geocode_memo) > REVERSE_GEOCODE_MEMO_SIZE:
+                _reverse_geocode_memo.popitem(last=False)
+    return address
+
+
+def _reverse_geocode_remote(lat: float, lon: float) -> str | None:
     key = f"rev:{lat},{lon}"
     if geocode_cache:
         try:
@@ -441,7 +765,7 @@ def reverse_geocode_coords(lat: float, lon: float) -> str | None:
         except Exception:
             pass
     try:
-        location = geolocator.reverse((lat, lon))
+        location = _nominatim_rate_limit(geolocator.reverse, (lat, lon))
     except Exception:
         return None
     if not location:
@@ -455,6 +779,14 @@ def reverse_geocode_coords(lat: float, lon: float) -> str | None:
     return address
 
 
+def submit_reverse_geocodes(coords: list[tuple[float, float]]) -> list[Future]:
+    """Start reverse geocoding ``(lat, lon)`` pairs in the background."""
+    return [
+        _geocode_executor.submit(reverse_geocode_coords, lat, lon)
+        for lat, lon in coords
+    ]
+
+
 COORD_OUT_OF_RANGE_MSG = 'Coordinates out of range'
 
 
@@ -701,18 +1033,43 @@ def extract_geodata(meta: dict) -> list[dict]:
     return geoms
 
 
+def point_coordinates(geodata: list[dict]) -> set[tuple]:
+    """Return the ``(lon, lat)`` pairs of the Point features in ``geodata``."""
+    points = set()
+    for feat in geodata:
+        geometry = feat.get('geometry') or {}
+        coords = geometry.get('coordinates')
+        if (
+            geometry.get('type') == 'Point'
+            and isinstance(coords, list)
+            and len(coords) == 2
+            and all(isinstance(c, (int, float)) for c in coords)
+        ):
+            points.add(tuple(coords))
+    return points
+
+
 LINK_RE = re.compile(r"\[\[([^\]|]+)(?:\|[^\]]*)?\]\]")
 
 
 def update_post_links(post: "Post") -> None:
-    """Update outgoing link records for ``post`` based on its body."""
+    """Update outgoing link records for ``post`` based on its body.
+
+    New links are written by one ``INSERT ... SELECT`` over the target
+    posts, so their ids never pass through Python.
+    """
     PostLink.query.filter_by(source_id=post.id).delete()
-    targets = LINK_RE.findall(post.body or "")
-    for target in targets:
-        target = target.strip()
-        target_post = Post.query.filter_by(path=target, language=post.language).first()
-        if target_post and target_post.id != post.id:
-            db.session.add(PostLink(source_id=post.id, target_id=target_post.id))
+    targets = {target.strip() for target in LINK_RE.findall(post.body or "")}
+    if not targets:
+        return
+    target_ids = select(literal(post.id), Post.id).where(
+        Post.language == post.language,
+        Post.path.in_(targets),
+        Post.id != post.id,
+    )
+    db.session.execute(
+        insert(PostLink).from_select(["source_id", "target_id"], target_ids)
+    )
 
 
 class WikiLinkInlineProcessor(InlineProcessor):
@@ -771,22 +1128,13 @@ class TagLinkInlineProcessor(InlineProcessor):
         return el, m.start(0), m.end(0)
 
 
-class TagLinkExtension(Extension):
-    """Markdown extension that auto-links tag names with tooltips."""
+def tag_link_processor(tag_map: dict[str, dict[str, str]]) -> TagLinkInlineProcessor:
+    """Return an inline processor linking every term in ``tag_map``."""
+    pattern = r'(?i)\b(' + '|'.join(re.escape(t) for t in tag_map) + r')\b'
+    return TagLinkInlineProcessor(pattern, tag_map)
 
-    def __init__(self, tag_map: dict[str, dict[str, str]], **kwargs):
-        self.tag_map = tag_map
-        super().__init__(**kwargs)
 
-    def extendMarkdown(self, md):
-        if not self.tag_map:
-            return
-        pattern = r'(?i)\b(' + '|'.join(re.escape(t) for t in self.tag_map) + r')\b'
-        md.inlinePatterns.register(
-            TagLinkInlineProcessor(pattern, self.tag_map),
-            'taglink',
-            74,
-        )
+_LIST_NUMBER_RE = re.compile(r'(\d+)')
 
 
 class PreserveOListProcessor(OListProcessor):
@@ -852,7 +1200,7 @@ class PreserveOListProcessor(OListProcessor):
         for line in block.split('\n'):
             m = self.CHILD_RE.match(line)
             if m:
-                num_match = re.match(r'(\d+)', m.group(1))
+                num_match = _LIST_NUMBER_RE.match(m.group(1))
                 num = num_match.group(1) if num_match else None
                 if not items and self.TAG == 'ol' and num:
                     self.STARTSWITH = num
@@ -876,6 +1224,14 @@ class PreserveOrderedListExtension(Extension):
         )
 
 
+# Patterns used while post-processing rendered Markdown
+_TAG_LINK_RE = re.compile(r'<a[^>]*class="tag-link"[^>]*>(.*?)</a>', re.DOTALL)
+_DISPLAY_MATH_RE = re.compile(r'\$\$.*?\$\$', re.DOTALL)
+_PAREN_MATH_RE = re.compile(r'\\\(.*?\\\)', re.DOTALL)
+_BRACKET_MATH_RE = re.compile(r'\\\[.*?\\\]', re.DOTALL)
+_WRAPPED_MATH_RE = re.compile(r'<p>\s*(\$\$[\s\S]*?\$\$)\s*</p>')
+
+
 # Utility to strip nested tag links inside regular hyperlinks
 def sanitize_tag_links(html: str) -> str:
     try:
@@ -896,17 +1252,11 @@ def sanitize_tag_links(html: str) -> str:
     cleaned = ''.join(tostring(child, encoding='unicode') for child in root)
 
     def strip_links(match: re.Match) -> str:
-        segment = match.group(0)
-        return re.sub(
-            r'<a[^>]*class="tag-link"[^>]*>(.*?)</a>',
-            r'\1',
-            segment,
-            flags=re.DOTALL,
-        )
+        return _TAG_LINK_RE.sub(r'\1', match.group(0))
 
-    cleaned = re.sub(r'\$\$.*?\$\$', strip_links, cleaned, flags=re.DOTALL)
-    cleaned = re.sub(r'\\\(.*?\\\)', strip_links, cleaned, flags=re.DOTALL)
-    cleaned = re.sub(r'\\\[.*?\\\]', strip_links, cleaned, flags=re.DOTALL)
+    cleaned = _DISPLAY_MATH_RE.sub(strip_links, cleaned)
+    cleaned = _PAREN_MATH_RE.sub(strip_links, cleaned)
+    cleaned = _BRACKET_MATH_RE.sub(strip_links, cleaned)
     return cleaned
 
 
@@ -917,7 +1267,7 @@ def unwrap_math_blocks(html: str) -> str:
     recognizing multi-line display formulas. Unwrap those paragraphs so that
     MathJax sees the raw ``$$`` delimiters.
     """
-    return re.sub(r'<p>\s*(\$\$[\s\S]*?\$\$)\s*</p>', r'\1', html)
+    return _WRAPPED_MATH_RE.sub(r'\1', html)
 
 
 # Protect math expressions from Markdown processing
@@ -945,6 +1295,13 @@ def restore_math_segments(text: str, segments: dict[str, str]) -> str:
     return text
 
 
+# Scanners used by ``detect_latex_parens``: the next math delimiter or
+# opening parenthesis, parenthesis/newline boundaries and LaTeX markers.
+_LATEX_SCAN_RE = re.compile(r'\$\$|\$|\(')
+_PAREN_SCAN_RE = re.compile(r'[()\n]')
+_LATEX_MARKER_RE = re.compile(r'[\\_{}]')
+
+
 def detect_latex_parens(text: str) -> str:
     """Convert parenthesized LaTeX expressions to ``$$`` blocks.
 
@@ -964,87 +1321,89 @@ def detect_latex_parens(text: str) -> str:
         parentheses surround the LaTeX expression. Only balanced pairs that
         enclose the full string are stripped, leaving necessary inner
         parentheses intact.
+
+        The number of removable pairs is found in a single pass: the ``t``-th
+        outer pair wraps the string only if the running depth stays above
+        ``t`` everywhere between its two parentheses.
         """
 
-        while s.startswith('(') and s.endswith(')'):
-            depth = 0
-            balanced = True
-            for idx, ch in enumerate(s):
-                if ch == '(':
-                    depth += 1
-                elif ch == ')':
-                    depth -= 1
-                    if depth == 0 and idx != len(s) - 1:
-                        balanced = False
-                        break
-            if depth != 0:
-                balanced = False
-            if not balanced:
-                break
-            s = s[1:-1]
-        return s
+        n = len(s)
+        layers = min(n - len(s.lstrip('(')), n - len(s.rstrip(')')))
+        if not layers:
+            return s
+        depth = 0
+        for idx, ch in enumerate(s):
+            if ch == '(':
+                depth += 1
+            elif ch == ')':
+                depth -= 1
+            if depth < layers and depth <= idx and depth <= n - 2 - idx:
+                layers = max(depth, 0)
+                if not layers:
+                    return s
+        if depth != 0:
+            return s
+        return s[layers:n - layers]
 
     out: list[str] = []
     i = 0
-    in_math = False
-    math_delim = ''
-    while i < len(text):
-        ch = text[i]
-        if ch == '$':
-            # Track math regions delimited by $ or $$ so we don't try to
+    n = len(text)
+    while i < n:
+        # Jump straight to the next math delimiter or opening parenthesis.
+        m = _LATEX_SCAN_RE.search(text, i)
+        if m is None:
+            out.append(text[i:])
+            break
+        start = m.start()
+        out.append(text[i:start])
+        token = m.group()
+        if token != '(':
+            # Copy $ and $$ math regions verbatim so we don't try to
             # auto-detect parentheses inside real LaTeX blocks.
-            if in_math:
-                if math_delim == '$$' and text.startswith('$$', i):
-                    in_math = False
-                    out.append('$$')
-                    i += 2
-                    continue
-                if math_delim == '$' and text[i] == '$':
-                    in_math = False
-                    out.append('$')
-                    i += 1
-                    continue
+            end = text.find(token, m.end())
+            if end == -1:
+                out.append(text[start:])
+                break
+            i = end + len(token)
+            out.append(text[start:i])
+            continue
+        line_end = text.find('\n', start)
+        if line_end == -1:
+            line_end = n
+        if not _LATEX_MARKER_RE.search(text, start + 1, line_end):
+            # Without a marker before the end of the line neither this nor
+            # any later parenthesis on it can be LaTeX; skip to the next
+            # math delimiter or line.
+            dollar = text.find('$', start + 1, line_end)
+            i = dollar if dollar != -1 else line_end
+            out.append(text[start:i])
+            continue
+        depth = 0
+        close = -1
+        for p in _PAREN_SCAN_RE.finditer(text, start):
+            c = p.group()
+            if c == '\n':
+                break
+            if c == '(':
+                depth += 1
             else:
-                if text.startswith('$$', i):
-                    in_math = True
-                    math_delim = '$$'
-                    out.append('$$')
-                    i += 2
-                    continue
-                in_math = True
-                math_delim = '$'
-                out.append('$')
-                i += 1
-                continue
-        if not in_math and ch == '(':
-            j = i + 1
-            depth = 1
-            has_newline = False
-            is_latex = False
-            while j < len(text) and depth > 0:
-                c = text[j]
-                if c == '\n':
-                    has_newline = True
+                depth -= 1
+                if depth == 0:
+                    close = p.start()
                     break
-                if c == '(':
-                    depth += 1
-                elif c == ')':
-                    depth -= 1
-                    if depth == 0:
-                        break
-                if c in '\\_{}':
-                    is_latex = True
-                j += 1
-            if depth == 0 and not has_newline and is_latex:
-                content = strip_outer_parentheses(text[i + 1:j])
-                out.append(f"\\({content}\\)")
-                i = j + 1
-                continue
-        out.append(ch)
-        i += 1
+        if close != -1 and _LATEX_MARKER_RE.search(text, start + 1, close):
+            content = strip_outer_parentheses(text[start + 1:close])
+            out.append(f"\\({content}\\)")
+            i = close + 1
+            continue
+        out.append('(')
+        i = start + 1
     return ''.join(out)
 
 
+_INLINE_DOUBLE_DOLLAR_RE = re.compile(r'\$\$([^\n]*?)\$\$')
+
+
 def convert_inline_dollars(text: str) -> str:
     """Replace inline ``$$`` math with ``\(\)`` delimiters.
 
@@ -1062,17 +1421,122 @@ def convert_inline_dollars(text: str) -> str:
             return f"\\({match.group(1)}\\)"
         return match.group(0)
 
-    return re.sub(r'\$\$([^\n]*?)\$\$', repl, text)
+    return _INLINE_DOUBLE_DOLLAR_RE.sub(repl, text)
 
 
-# Markup rendering helpers
-def render_markdown(
-    text: str,
-    base_url: str = '/',
-    with_toc: bool = False,
-    enable_mathjax: bool = False,
-) -> tuple[str, str]:
-    """Return HTML and optional TOC from Markdown text with wiki links."""
+# Rendered Markdown keyed by a digest of the input and the render options.
+# Entries also store the source text so digest collisions are detected.
+MARKDOWN_CACHE_SIZE = 512
+_markdown_cache: OrderedDict[tuple, tuple[float, str, str, str]] = OrderedDict()
+_markdown_cache_lock = threading.Lock()
+
+# Bumped whenever data feeding the automatic tag links changes so cached
+# renders built from an older tag map are no longer used. The counter is
+# per process, so renders and the tag vocabulary are also rebuilt after
+# ``TAG_MAP_TTL`` seconds to pick up tag changes made by other workers.
+_tag_map_version = 0
+TAG_MAP_TTL = 60
+
+
+def _bump_tag_map_version(*args, **kwargs) -> None:
+    global _tag_map_version
+    _tag_map_version += 1
+
+
+for _table in (Tag.__table__, Post.__table__, PostTag.__table__, PostMetadata.__table__):
+    event.listen(_table, 'after_create', _bump_tag_map_version)
+    event.listen(_table, 'after_drop', _bump_tag_map_version)
+
+
+@event.listens_for(db.session, 'after_flush')
+def _track_tag_map_changes(session, flush_context) -> None:
+    """Invalidate cached renders when tags, posts or their metadata change.
+
+    View counter updates are ignored so that every page view does not flush
+    the cache; tooltip view counts refresh on the next content change. Only
+    tagged posts appear in tag link tooltips, so creating or editing an
+    untagged post leaves cached renders in place.
+    """
+    for obj in session.deleted:
+        if isinstance(obj, (Tag, Post, PostMetadata)):
+            _bump_tag_map_version()
+            return
+    for obj in session.new:
+        if (
+            isinstance(obj, Tag)
+            or (isinstance(obj, Post) and obj.tags)
+            or (isinstance(obj, PostMetadata) and obj.key != 'views')
+        ):
+            _bump_tag_map_version()
+            return
+    for obj in session.dirty:
+        if isinstance(obj, Post):
+            changed = inspect(obj).attrs.tags.history.has_changes() or (
+                bool(obj.tags)
+                and session.is_modified(obj, include_collections=False)
+            )
+        elif isinstance(obj, Tag):
+            changed = session.is_modified(obj, include_collections=False)
+        elif isinstance(obj, PostMetadata):
+            changed = obj.key != 'views' and session.is_modified(obj)
+        else:
+            changed = False
+        if changed:
+            _bump_tag_map_version()
+            return
+
+
+# Word tokens of each tag's name and synonyms, rebuilt when the tag map
+# version changes. A tag can only be auto-linked in a text containing every
+# token of one of its terms, so other tags are left out of the tag map.
+_tag_vocabulary: tuple[int, float, dict[str, list[frozenset[str]]]] | None = None
+_WORD_RE = re.compile(r'\w+')
+
+
+def _candidate_tag_names(text: str) -> set[str]:
+    """Return names of tags that may have a term occurring in ``text``."""
+    global _tag_vocabulary
+    vocabulary = _tag_vocabulary
+    version = _tag_map_version
+    now = time.monotonic()
+    if (
+        vocabulary is None
+        or vocabulary[0] != version
+        or now - vocabulary[1] > TAG_MAP_TTL
+    ):
+        terms = {
+            tag.name: [
+                frozenset(_WORD_RE.findall(syn)) for syn in tag_row_synonyms(tag)
+            ]
+            for tag in Tag.query.all()
+        }
+        vocabulary = _tag_vocabulary = (version, now, terms)
+    words = set(_WORD_RE.findall(text.lower()))
+    return {
+        name
+        for name, term_tokens in vocabulary[2].items()
+        if any(tokens <= words for tokens in term_tokens)
+    }
+
+
+# Markdown instances are reused with ``reset()`` instead of rebuilding the
+# parser and extension registry per render. They are not thread-safe, so
+# each thread keeps its own, keyed by the options fixed at construction.
+MARKDOWN_INSTANCE_CACHE_SIZE = 16
+_markdown_local = threading.local()
+
+
+def _markdown_instance(
+    base_url: str, with_toc: bool, enable_mathjax: bool
+) -> markdown.Markdown:
+    instances = getattr(_markdown_local, 'instances', None)
+    if instances is None:
+        instances = _markdown_local.instances = OrderedDict()
+    key = (base_url, with_toc, enable_mathjax)
+    md = instances.get(key)
+    if md is not None:
+        instances.move_to_end(key)
+        return md
     extensions: list[Extension | str] = [
         WikiLinkExtension(base_url=base_url),
         PreserveOrderedListExtension(),
@@ -1082,24 +1546,95 @@ def render_markdown(
     if enable_mathjax:
         extensions.append('pymdownx.arithmatex')
         extension_configs['pymdownx.arithmatex'] = {'generic': True}
+    if with_toc:
+        extensions.append('toc')
+    md = instances[key] = markdown.Markdown(
+        extensions=extensions, extension_configs=extension_configs, tab_length=1
+    )
+    while len(instances) > MARKDOWN_INSTANCE_CACHE_SIZE:
+        instances.popitem(last=False)
+    return md
+
+
+# Three-space list indents are collapsed to one to match ``tab_length=1``
+_LIST_INDENT_RE = re.compile(r'(?m)^\s{3}([*+-]|\d+\.)')
+
+
+# Markup rendering helpers
+def render_markdown(
+    text: str,
+    base_url: str = '/',
+    with_toc: bool = False,
+    enable_mathjax: bool = False,
+) -> tuple[str, str]:
+    """Return HTML and optional TOC from Markdown text with wiki links.
+
+    Results are memoized in an LRU cache keyed by a BLAKE2b digest of
+    ``text`` together with the render options and the current tag map
+    version. Entries older than ``TAG_MAP_TTL`` seconds are rendered again.
+    """
+    text = text or ''
+    digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    key = (digest, base_url, with_toc, enable_mathjax, _tag_map_version)
+    now = time.monotonic()
+    with _markdown_cache_lock:
+        cached = _markdown_cache.get(key)
+        if (
+            cached is not None
+            and now - cached[0] <= TAG_MAP_TTL
+            and cached[1] == text
+        ):
+            _markdown_cache.move_to_end(key)
+            return Markup(cached[2]), Markup(cached[3])
+    html, toc, cacheable = _render_markdown_uncached(
+        text, base_url, with_toc, enable_mathjax
+    )
+    if cacheable:
+        with _markdown_cache_lock:
+            _markdown_cache[key] = (now, text, str(html), str(toc))
+            _markdown_cache.move_to_end(key)
+            while len(_markdown_cache) > MARKDOWN_CACHE_SIZE:
+                _markdown_cache.popitem(last=False)
+    return html, toc
+
+
+def _render_markdown_uncached(
+    text: str,
+    base_url: str,
+    with_toc: bool,
+    enable_mathjax: bool,
+) -> tuple[str, str, bool]:
+    """Render ``text`` and report whether the result may be cached."""
+    cacheable = True
     # Attempt to add automatic tag linking if tags are available
+    tag_map: dict[str, dict[str, str]] = {}
     try:
-        tag_map: dict[str, dict[str, str]] = {}
-        for tag in Tag.query.all():
+        candidates = _candidate_tag_names(text)
+        # Load the candidate tags, their posts and the posts' metadata in
+        # three queries instead of lazy-loading each relationship.
+        tags = (
+            Tag.query.filter(Tag.name.in_(candidates))
+            .options(selectinload(Tag.posts).selectinload(Post.metadata))
+            .order_by(Tag.id)
+            .all()
+            if candidates
+            else []
+        )
+        for tag in tags:
             posts: list[dict[str, object]] = []
             for p in tag.posts:
                 if not p.title or not p.body:
                     continue
+                meta = {m.key: m.value for m in p.metadata}
                 doc: dict[str, object] = {
                     'title': p.display_title,
                     'url': f"/{p.language}/{p.path}",
                     'snippet': (p.body.splitlines()[0] if p.body else ''),
-                    'views': get_view_count(p),
+                    'views': int(meta.get('views', 0)),
                 }
                 lat = p.latitude
                 lon = p.longitude
                 if lat is None or lon is None:
-                    meta = {m.key: m.value for m in p.metadata}
                     locs = meta.get('locations')
                     if isinstance(locs, list) and locs:
                         first = locs[0]
@@ -1124,45 +1659,86 @@ def render_markdown(
                     'url': f"/tag/{quote(tag.name)}",
                     'tooltip': json.dumps(posts),
                 }
-                for syn in get_tag_synonyms(tag.name):
+                for syn in tag_row_synonyms(tag):
                     tag_map.setdefault(syn, info)
-        if tag_map:
-            extensions.append(TagLinkExtension(tag_map))
     except Exception:
-        pass
-    normalized = re.sub(r'(?m)^\s{3}([*+-]|\d+\.)', r' \1', text or '')
+        tag_map = {}
+        cacheable = False
+    normalized = _LIST_INDENT_RE.sub(r' \1', text or '')
     if enable_mathjax:
         normalized = detect_latex_parens(normalized)
         normalized = convert_inline_dollars(normalized)
-    if with_toc:
-        md = markdown.Markdown(
-            extensions=extensions + ['toc'],
-            extension_configs=extension_configs,
-            tab_length=1,
-        )
-        html = md.convert(normalized)
-        html = sanitize_tag_links(html)
-        html = unwrap_math_blocks(html)
-        if not getattr(md, 'toc_tokens', None):
-            return Markup(html), Markup('')
-        return Markup(html), Markup(md.toc)
-    html = markdown.markdown(
-        normalized,
-        extensions=extensions,
-        extension_configs=extension_configs,
-        tab_length=1,
-    )
+    md = _markdown_instance(base_url, with_toc, enable_mathjax)
+    if tag_map:
+        md.inlinePatterns.register(tag_link_processor(tag_map), 'taglink', 74)
+    elif 'taglink' in md.inlinePatterns:
+        md.inlinePatterns.deregister('taglink')
+    html = md.reset().convert(normalized)
     html = sanitize_tag_links(html)
     html = unwrap_math_blocks(html)
-    return Markup(html), Markup('')
+    if not with_toc or not getattr(md, 'toc_tokens', None):
+        return Markup(html), Markup(''), cacheable
+    return Markup(html), Markup(md.toc), cacheable
+
+
+@lru_cache(maxsize=MARKDOWN_CACHE_SIZE)
+def highlight_keywords(html: str, language: str) -> str:
+    """Return ``html`` with YAKE keyword highlighting applied.
+
+    Memoized on the rendered HTML and language, so repeat views of an
+    unchanged post skip keyword extraction.
+    """
+    return apply_keyword_highlight_plugin(html, language)
+
+
+# Process-wide snapshot of the ``setting`` table, loaded with one query on
+# first use and discarded whenever a Setting row is written or committed.
+# Writes made by other worker processes are picked up once the snapshot is
+# older than ``SETTINGS_CACHE_TTL`` seconds.
+SETTINGS_CACHE_TTL = 60
+_settings_cache: dict[str, str | None] | None = None
+_settings_cache_loaded_at = 0.0
+
+
+def _invalidate_settings_cache(*args, **kwargs) -> None:
+    global _settings_cache
+    _settings_cache = None
+
+
+event.listen(Setting.__table__, 'after_create', _invalidate_settings_cache)
+event.listen(Setting.__table__, 'after_drop', _invalidate_settings_cache)
+
+
+@event.listens_for(db.session, 'after_flush')
+def _track_setting_changes(session, flush_context) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Setting):
+            session.info['settings_changed'] = True
+            _invalidate_settings_cache()
+            return
+
+
+@event.listens_for(db.session, 'after_commit')
+@event.listens_for(db.session, 'after_rollback')
+def _settings_transaction_finished(session) -> None:
+    # Drop the snapshot again once the write is visible (or undone) so that
+    # a concurrent reload between flush and commit cannot keep stale values.
+    if session.info.pop('settings_changed', False):
+        _invalidate_settings_cache()
 
 
 def get_setting(key: str, default: str = '') -> str:
-    try:
-        setting = Setting.query.filter_by(key=key).first()
-    except Exception:
-        return default
-    return setting.value if setting else default
+    global _settings_cache, _settings_cache_loaded_at
+    settings = _settings_cache
+    now = time.monotonic()
+    if settings is None or now - _settings_cache_loaded_at > SETTINGS_CACHE_TTL:
+        try:
+            settings = dict(db.session.query(Setting.key, Setting.value).all())
+        except Exception:
+            return default
+        _settings_cache = settings
+        _settings_cache_loaded_at = now
+    return settings[key] if key in settings else default
 
 
 def get_category_tags(language: str | None = None) -> list[tuple[str, str]]:
@@ -1179,10 +1755,20 @@ def get_category_tags(language: str | None = None) -> list[tuple[str, str]]:
     raw = get_setting('post_categories', '')
     if not raw:
         return []
+    return list(_parse_category_tags(raw, lang))
+
+
+@lru_cache(maxsize=64)
+def _parse_category_tags(raw: str, lang: str) -> tuple[tuple[str, str], ...]:
+    """Parse the ``post_categories`` setting for ``lang``.
+
+    Keyed on the raw setting value, so an edited setting is simply a new key
+    and needs no explicit invalidation.
+    """
     try:
         mapping = json.loads(raw)
     except json.JSONDecodeError:
-        return [(t.strip(), t.strip()) for t in raw.split(',') if t.strip()]
+        return tuple((t.strip(), t.strip()) for t in raw.split(',') if t.strip())
 
     categories: list[tuple[str, str]] = []
     if isinstance(mapping, dict):
@@ -1192,22 +1778,116 @@ def get_category_tags(language: str | None = None) -> list[tuple[str, str]]:
             else:
                 label = slug
             categories.append((slug, label))
-    return categories
+    return tuple(categories)
 
 
 @lru_cache(maxsize=None)
-def get_tag_synonyms(name: str) -> set[str]:
-    """Return a set of lowercase synonyms for a tag name, including itself."""
+def wordnet_synonyms(name: str) -> frozenset[str] | None:
+    """Return lowercase WordNet synonyms for ``name`` including itself.
+
+    Returns ``None`` if the WordNet corpus is unavailable and cannot be
+    downloaded.
+    """
     try:
         synsets = wn.synsets(name)
     except LookupError:
         nltk.download('wordnet', quiet=True)
-        synsets = wn.synsets(name)
+        try:
+            synsets = wn.synsets(name)
+        except LookupError:
+            return None
     synonyms = {name.lower()}
     for syn in synsets:
         for lemma in syn.lemmas():
             synonyms.add(lemma.name().replace('_', ' ').lower())
-    return synonyms
+    return frozenset(synonyms)
+
+
+@lru_cache(maxsize=None)
+def get_tag_synonyms(name: str) -> set[str]:
+    """Return a set of lowercase synonyms for a tag name, including itself.
+
+    Synonyms precomputed in ``Tag.synonyms`` are used when a tag with this
+    name exists so WordNet is only consulted for other names.
+    """
+    try:
+        row = (
+            db.session.query(Tag.synonyms)
+            .filter(func.lower(Tag.name) == name.lower())
+            .first()
+        )
+    except Exception:
+        row = None
+    if row and row[0]:
+        return set(json.loads(row[0]))
+    synonyms = wordnet_synonyms(name)
+    return set(synonyms) if synonyms else {name.lower()}
+
+
+def stored_tag_synonyms(name: str) -> str | None:
+    """Return the ``Tag.synonyms`` value for a tag called ``name``.
+
+    May download the WordNet corpus, so call it before adding the tag to the
+    session rather than from a flush event.
+    """
+    synonyms = wordnet_synonyms(name)
+    return json.dumps(sorted(synonyms)) if synonyms else None
+
+
+def tag_row_synonyms(tag: Tag) -> set[str]:
+    """Return the synonyms of an already loaded ``tag`` without re-querying it."""
+    if tag.synonyms:
+        return set(json.loads(tag.synonyms))
+    synonyms = wordnet_synonyms(tag.name)
+    return set(synonyms) if synonyms else {tag.name.lower()}
+
+
+def tagged_post_ids(names: set[str]):
+    """Return a subquery selecting ids of posts tagged with any of ``names``.
+
+    ``names`` must be lowercase. Matching starts from the ``lower(name)``
+    index on tags rather than checking the tags of every post.
+    """
+    return (
+        select(PostTag.post_id)
+        .join(Tag, Tag.id == PostTag.tag_id)
+        .where(func.lower(Tag.name).in_(names))
+    )
+
+
+_tag_synonym_cache_clear = get_tag_synonyms.cache_clear
+
+
+def _clear_tag_synonym_cache(*args, **kwargs) -> None:
+    _tag_synonym_cache_clear()
+
+
+for _event in ('after_insert', 'after_update', 'after_delete'):
+    event.listen(Tag, _event, _clear_tag_synonym_cache)
+event.listen(Tag.__table__, 'after_drop', _clear_tag_synonym_cache)
+
+
+def backfill_tag_synonyms() -> int:
+    """Populate ``Tag.synonyms`` for tags created before the column existed.
+
+    Returns the number of tags updated. Tags left empty keep falling back to
+    WordNet in :func:`get_tag_synonyms`, so running this is optional.
+    """
+    with app.app_context():
+        updated = 0
+        for tag in Tag.query.filter(Tag.synonyms.is_(None)).all():
+            tag.synonyms = stored_tag_synonyms(tag.name)
+            if tag.synonyms:
+                updated += 1
+        if updated:
+            db.session.commit()
+        return updated
+
+
+@app.cli.command('backfill-tag-synonyms')
+def backfill_tag_synonyms_command() -> None:
+    """Store WordNet synonyms for tags that have none yet."""
+    click.echo(f'Updated {backfill_tag_synonyms()} tags.')
 
 
 def resolve_tag(name: str) -> Tag | None:
@@ -1217,16 +1897,30 @@ def resolve_tag(name: str) -> Tag | None:
     category labels defined in the ``post_categories`` setting. Returns ``None``
     if no matching tag is found."""
 
-    # Direct lookup against existing tag names or synonyms
-    tag = Tag.query.filter(func.lower(Tag.name) == name.lower()).first()
-    if tag:
-        return tag
+    lower_name = name.lower()
     syns = get_tag_synonyms(name)
-    tag = Tag.query.filter(func.lower(Tag.name).in_(syns)).first()
-    if tag:
-        return tag
+    slug = _category_slug_for_label(lower_name)
+    candidates = {lower_name, *syns}
+    if slug:
+        candidates.add(slug)
+    # One indexed lookup for every candidate, then prefer a direct match,
+    # then a synonym and finally the category slug.
+    matches = (
+        Tag.query.filter(func.lower(Tag.name).in_(candidates))
+        .order_by(Tag.id)
+        .all()
+    )
+    by_name = {t.name.lower(): t for t in reversed(matches)}
+    if lower_name in by_name:
+        return by_name[lower_name]
+    for tag in matches:
+        if tag.name.lower() in syns:
+            return tag
+    return by_name.get(slug) if slug else None
+
 
-    # Fallback to category translations defined in settings
+def _category_slug_for_label(lower_name: str) -> str | None:
+    """Return the lowercase category slug whose slug or label is ``lower_name``."""
     raw = get_setting('post_categories', '')
     if not raw:
         return None
@@ -1236,14 +1930,13 @@ def resolve_tag(name: str) -> Tag | None:
         return None
 
     if isinstance(mapping, dict):
-        lower_name = name.lower()
         for slug, translations in mapping.items():
             if slug.lower() == lower_name:
-                return Tag.query.filter(func.lower(Tag.name) == slug.lower()).first()
+                return slug.lower()
             if isinstance(translations, dict):
                 for label in translations.values():
                     if label.lower() == lower_name:
-                        return Tag.query.filter(func.lower(Tag.name) == slug.lower()).first()
+                        return slug.lower()
     return None
 
 
@@ -1256,6 +1949,12 @@ def get_user_timezone() -> str:
     return get_setting('timezone', 'UTC') or 'UTC'
 
 
+@lru_cache(maxsize=1)
+def _timezones_by_lower() -> dict[str, str]:
+    """Return a mapping of lowercase timezone names to canonical names."""
+    return {name.lower(): name for name in zoneinfo.available_timezones()}
+
+
 def normalize_timezone(tz: str) -> str | None:
     """Return a canonical timezone name or ``None`` if invalid.
 
@@ -1267,26 +1966,36 @@ def normalize_timezone(tz: str) -> str | None:
         ZoneInfo(tz)
         return tz
     except ZoneInfoNotFoundError:
-        for name in zoneinfo.available_timezones():
-            if name.lower() == tz.lower():
-                return name
-    return None
+        return _timezones_by_lower().get(tz.lower())
+
+
+@lru_cache(maxsize=64)
+def _zoneinfo(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+def _request_timezone() -> tuple[str, timezone | ZoneInfo]:
+    """Return the user's timezone name and tzinfo, resolved once per request."""
+    resolved = g.get('user_timezone')
+    if resolved is None:
+        tz_name = get_user_timezone()
+        try:
+            resolved = (tz_name, _zoneinfo(tz_name))
+        except (ZoneInfoNotFoundError, ValueError):
+            resolved = ('UTC', timezone.utc)
+        g.user_timezone = resolved
+    return resolved
 
 
 @app.template_filter('format_datetime')
 def format_datetime(value: datetime, fmt: str = '%Y-%m-%d %H:%M %Z') -> str:
-    tz_name = get_user_timezone()
-    try:
-        tzinfo = ZoneInfo(tz_name)
-    except ZoneInfoNotFoundError:
-        tzinfo = timezone.utc
-        tz_name = 'UTC'
+    tz_name, tzinfo = _request_timezone()
     dt = value
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     local_dt = dt.astimezone(tzinfo)
     formatted = local_dt.strftime(fmt)
-    abbr = local_dt.strftime('%Z')
+    abbr = local_dt.tzname()
     if '%Z' not in fmt:
         formatted = f"{formatted} {abbr}"
     if tz_name != abbr:
@@ -1299,28 +2008,88 @@ def inject_settings():
     return {'get_setting': get_setting}
 
 
-def get_view_count(post: Post) -> int:
-    """Return total view count for a post."""
-    meta = next((m for m in post.metadata if m.key == 'views'), None)
-    return int(meta.value) if meta else 0
+def increment_view_count(post_id: int) -> int:
+    """Increment and return the view count for a post and record the view.
 
-
-def increment_view_count(post: Post) -> int:
-    """Increment and return the view count for a post and record the view."""
-    meta = PostMetadata.query.filter_by(post_id=post.id, key='views').first()
-    if meta:
-        meta.value = int(meta.value) + 1
+    On SQLite the counter is bumped with a single ``INSERT ... ON CONFLICT
+    DO UPDATE ... RETURNING`` statement instead of a read-modify-write.
+    """
+    if db.engine.dialect.name == 'sqlite':
+        current = type_coerce(PostMetadata.value, Integer)
+        stmt = (
+            sqlite_insert(PostMetadata)
+            .values(post_id=post_id, key='views', value=1)
+            .on_conflict_do_update(
+                index_elements=['post_id', 'key'], set_={'value': current + 1}
+            )
+            .returning(current)
+        )
+        views = db.session.execute(stmt).scalar_one()
     else:
-        meta = PostMetadata(post=post, key='views', value=1)
-        db.session.add(meta)
-    db.session.add(PostView(post=post, ip_address=request.remote_addr))
+        meta = PostMetadata.query.filter_by(post_id=post_id, key='views').first()
+        if meta:
+            meta.value = int(meta.value) + 1
+        else:
+            meta = PostMetadata(post_id=post_id, key='views', value=1)
+            db.session.add(meta)
+        views = meta.value
+    db.session.add(PostView(post_id=post_id, ip_address=request.remote_addr))
     db.session.commit()
-    return int(meta.value)
+    return int(views)
+
+
+def replace_post_metadata(post: Post, meta_dict: dict) -> None:
+    """Replace a post's metadata with ``meta_dict``, keeping its view count.
+
+    Stale keys go in one DELETE. On SQLite the remaining keys are written
+    with a single multi-row ``INSERT ... ON CONFLICT DO UPDATE``, so
+    unchanged keys keep their rows. A ``views`` entry is seeded if missing.
+    """
+    db.session.execute(
+        delete(PostMetadata)
+        .where(
+            PostMetadata.post_id == post.id,
+            PostMetadata.key.notin_(set(meta_dict) | {'views'}),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if db.engine.dialect.name == 'sqlite':
+        if meta_dict:
+            stmt = sqlite_insert(PostMetadata).values(
+                [{'post_id': post.id, 'key': k, 'value': v} for k, v in meta_dict.items()]
+            )
+            db.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=['post_id', 'key'],
+                    set_={'value': stmt.excluded.value},
+                )
+            )
+        db.session.execute(
+            sqlite_insert(PostMetadata)
+            .values(post_id=post.id, key='views', value='0')
+            .on_conflict_do_nothing(index_elements=['post_id', 'key'])
+        )
+        db.session.expire(post, ['metadata'])
+        return
+    existing = {
+        m.key: m for m in PostMetadata.query.filter_by(post_id=post.id).all()
+    }
+    for key, value in meta_dict.items():
+        if key in existing:
+            existing[key].value = value
+        else:
+            db.session.add(PostMetadata(post=post, key=key, value=value))
+    if 'views' not in existing:
+        db.session.add(PostMetadata(post=post, key='views', value='0'))
 
 
 @login_manager.user_loader
 def load_user(user_id: str):
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
+
+
+# Post lists show each title with its author; bodies are never rendered.
+POST_LIST_OPTIONS = (defer(Post.body), joinedload(Post.author))
 
 
 @app.route('/posts')
@@ -1338,7 +2107,9 @@ def all_posts():
         query = query.join(Post.tags).filter(func.lower(Tag.name).in_(syns))
 
     pagination = (
-        query.order_by(Post.id.desc()).paginate(page=page, per_page=20, error_out=False)
+        query.options(*POST_LIST_OPTIONS)
+        .order_by(Post.id.desc())
+        .paginate(page=page, per_page=20, error_out=False)
     )
     categories = get_category_tags()
     return render_template(
@@ -1355,12 +2126,35 @@ def index():
         else:
             language = select_locale() or app.config['BABEL_DEFAULT_LOCALE']
             doc_path = home_path
-        post = Post.query.filter_by(language=language, path=doc_path).first()
-        if post:
+        if path_taken(doc_path, language):
             return redirect(url_for('document', language=language, doc_path=doc_path))
     return all_posts()
 
 
+def _iter_posts_with_last_revision(limit: int | None = None):
+    """Yield ``(post, last_revision_at)`` for titled posts, newest first.
+
+    The latest revision time per post comes from one aggregated subquery,
+    so posts themselves need not be grouped.
+    """
+    last_rev = (
+        db.session.query(
+            Revision.post_id, func.max(Revision.created_at).label('ts')
+        )
+        .group_by(Revision.post_id)
+        .subquery()
+    )
+    query = (
+        db.session.query(Post, last_rev.c.ts)
+        .outerjoin(last_rev, last_rev.c.post_id == Post.id)
+        .filter(Post.title != '')
+        .order_by(Post.id.desc())
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return query.yield_per(100)
+
+
 @app.route('/rss.xml')
 def rss_feed():
     if get_setting('rss_enabled', 'false').lower() not in (
@@ -1374,38 +2168,38 @@ def rss_feed():
         limit = int(get_setting('rss_limit', '20'))
     except ValueError:
         limit = 20
-    posts = (
-        Post.query.filter(Post.title != '')
-        .order_by(Post.id.desc())
-        .limit(limit)
-        .all()
-    )
-    root = Element('rss', version='2.0')
-    channel = SubElement(root, 'channel')
     title = get_setting('site_title', 'Spacetime')
-    SubElement(channel, 'title').text = title
-    SubElement(channel, 'link').text = request.url_root.rstrip('/')
-    SubElement(channel, 'description').text = f'RSS feed for {title}'
-    for post in posts:
-        item = SubElement(channel, 'item')
-        SubElement(item, 'title').text = post.display_title
-        SubElement(item, 'link').text = url_for(
-            'document', language=post.language, doc_path=post.path, _external=True
-        )
-        SubElement(item, 'guid').text = f"{post.language}:{post.path}"
-        rev = (
-            Revision.query.filter_by(post_id=post.id)
-            .order_by(Revision.created_at.desc())
-            .first()
-        )
-        if rev:
-            pub = rev.created_at.replace(tzinfo=timezone.utc).strftime(
-                '%a, %d %b %Y %H:%M:%S GMT'
+
+    def generate():
+        yield "<?xml version='1.0' encoding='utf-8'?>\n"
+        yield '<rss version="2.0"><channel>'
+        for tag, value in (
+            ('title', title),
+            ('link', request.url_root.rstrip('/')),
+            ('description', f'RSS feed for {title}'),
+        ):
+            el = Element(tag)
+            el.text = value
+            yield tostring(el, encoding='unicode')
+        for post, last_rev in _iter_posts_with_last_revision(limit):
+            item = Element('item')
+            SubElement(item, 'title').text = post.display_title
+            SubElement(item, 'link').text = url_for(
+                'document', language=post.language, doc_path=post.path, _external=True
             )
-            SubElement(item, 'pubDate').text = pub
-        SubElement(item, 'description').text = post.body
-    xml = tostring(root, encoding='utf-8')
-    return Response(xml, mimetype='application/rss+xml')
+            SubElement(item, 'guid').text = f"{post.language}:{post.path}"
+            if last_rev:
+                pub = last_rev.replace(tzinfo=timezone.utc).strftime(
+                    '%a, %d %b %Y %H:%M:%S GMT'
+                )
+                SubElement(item, 'pubDate').text = pub
+            SubElement(item, 'description').text = post.body
+            yield tostring(item, encoding='unicode')
+        yield '</channel></rss>'
+
+    return Response(
+        stream_with_context(generate()), mimetype='application/rss+xml'
+    )
 
 
 @app.route('/robots.txt')
@@ -1420,27 +2214,22 @@ def robots_txt():
 
 @app.route('/sitemap.xml')
 def sitemap():
-    """Generate a basic XML sitemap of all posts."""
-    posts = (
-        Post.query.filter(Post.title != '')
-        .order_by(Post.id.desc())
-        .all()
-    )
-    root = Element('urlset', xmlns='http://www.sitemaps.org/schemas/sitemap/0.9')
-    for post in posts:
-        url_el = SubElement(root, 'url')
-        SubElement(url_el, 'loc').text = url_for(
-            'document', language=post.language, doc_path=post.path, _external=True
-        )
-        rev = (
-            Revision.query.filter_by(post_id=post.id)
-            .order_by(Revision.created_at.desc())
-            .first()
-        )
-        if rev:
-            SubElement(url_el, 'lastmod').text = rev.created_at.date().isoformat()
-    xml = tostring(root, encoding='utf-8')
-    return Response(xml, mimetype='application/xml')
+    """Stream a basic XML sitemap of all posts."""
+
+    def generate():
+        yield "<?xml version='1.0' encoding='utf-8'?>\n"
+        yield '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        for post, last_rev in _iter_posts_with_last_revision():
+            url_el = Element('url')
+            SubElement(url_el, 'loc').text = url_for(
+                'document', language=post.language, doc_path=post.path, _external=True
+            )
+            if last_rev:
+                SubElement(url_el, 'lastmod').text = last_rev.date().isoformat()
+            yield tostring(url_el, encoding='unicode')
+        yield '</urlset>'
+
+    return Response(stream_with_context(generate()), mimetype='application/xml')
 
 
 @app.route('/recent')
@@ -1471,7 +2260,7 @@ def register():
     if request.method == 'POST':
         username = request.form['username']
         password = request.form['password']
-        if User.query.filter_by(username=username).first():
+        if db.session.scalar(select(User.id).where(User.username == username)):
             flash(_('Username already exists'))
             return redirect(url_for('register'))
         user = User(username=username)
@@ -1550,21 +2339,17 @@ def profile(username: str):
         db.session.commit()
         flash(_('Profile updated'))
         return redirect(url_for('profile', username=user.username))
-    post_locations: list[dict[str, float | str]] = []
-    seen_loc_ids: set[int] = set()
-    for p in posts + edited_posts:
-        if p.id in seen_loc_ids:
-            continue
-        seen_loc_ids.add(p.id)
-        if p.latitude is not None and p.longitude is not None:
-            post_locations.append(
-                {
-                    'title': p.display_title,
-                    'lat': p.latitude,
-                    'lon': p.longitude,
-                    'url': url_for('document', language=p.language, doc_path=p.path),
-                }
-            )
+    unique_posts = {p.id: p for p in chain(posts, edited_posts)}.values()
+    post_locations: list[dict[str, float | str]] = [
+        {
+            'title': p.display_title,
+            'lat': p.latitude,
+            'lon': p.longitude,
+            'url': url_for('document', language=p.language, doc_path=p.path),
+        }
+        for p in unique_posts
+        if p.latitude is not None and p.longitude is not None
+    ]
     return render_template(
         'profile.html',
         user=user,
@@ -1573,7 +2358,7 @@ def profile(username: str):
         post_count=post_count,
         citation_count=citation_count,
         post_locations=post_locations,
-        post_locations_json=json.dumps(post_locations),
+        post_locations_json=to_json(post_locations),
         languages=app.config['LANGUAGES'],
     )
 
@@ -1630,21 +2415,96 @@ def admin_requested_posts():
     return render_template('admin/requested_posts.html', requests=reqs)
 
 
+# Maps ASCII letters and digits to themselves and every other byte to '-'.
+_SLUG_TABLE = bytes(
+    c if chr(c).isascii() and chr(c).isalnum() else ord('-') for c in range(256)
+)
+
+
 def _slugify(title: str) -> str:
-    slug = re.sub(r'[^a-zA-Z0-9]+', '-', title.strip().lower()).strip('-')
-    return slug or 'post'
+    """Return a URL slug for ``title``, transliterating accents to ASCII."""
+    raw = unicodedata.normalize('NFKD', title).encode('ascii', 'ignore')
+    slug = raw.lower().translate(_SLUG_TABLE)
+    while b'--' in slug:
+        slug = slug.replace(b'--', b'-')
+    return slug.strip(b'-').decode('ascii') or 'post'
 
 
 def generate_unique_path(title: str, language: str) -> str:
     base = _slugify(title)
+    existing = {
+        path
+        for (path,) in db.session.query(Post.path).filter(
+            Post.language == language,
+            or_(Post.path == base, Post.path.like(f'{base}-%')),
+        )
+    }
     path = base
     counter = 1
-    while Post.query.filter_by(path=path, language=language).first():
+    while path in existing:
         path = f"{base}-{counter}"
         counter += 1
     return path
 
 
+def path_taken(path: str, language: str, exclude_id: int | None = None) -> bool:
+    """Return whether another post already uses ``path`` in ``language``."""
+    stmt = select(Post.id).where(Post.path == path, Post.language == language)
+    if exclude_id is not None:
+        stmt = stmt.where(Post.id != exclude_id)
+    return db.session.scalar(stmt.limit(1)) is not None
+
+
+def get_or_create_tags(names: list[str]) -> list[Tag]:
+    """Return tags for ``names`` in order, creating missing ones.
+
+    Duplicate names are collapsed and existing tags are fetched with a
+    single ``IN`` query. On SQLite missing tags are written by one
+    ``INSERT ... ON CONFLICT DO NOTHING`` and read back with a second
+    query, since the ORM flush cannot batch inserts there.
+    """
+    names = list(dict.fromkeys(names))
+    if not names:
+        return []
+    existing = {t.name: t for t in Tag.query.filter(Tag.name.in_(names))}
+    missing = [name for name in names if name not in existing]
+    if missing and db.engine.dialect.name == 'sqlite':
+        rows = [
+            {'name': name, 'synonyms': stored_tag_synonyms(name)} for name in missing
+        ]
+        db.session.execute(
+            sqlite_insert(Tag).values(rows).on_conflict_do_nothing(
+                index_elements=['name']
+            )
+        )
+        # Core inserts bypass the Tag events that keep these caches current.
+        _tag_synonym_cache_clear()
+        _bump_tag_map_version()
+        existing.update(
+            (t.name, t) for t in Tag.query.filter(Tag.name.in_(missing))
+        )
+    tags = [
+        existing.get(name) or Tag(name=name, synonyms=stored_tag_synonyms(name))
+        for name in names
+    ]
+    db.session.add_all(t for t in tags if t.id is None)
+    return tags
+
+
+# langdetect's accuracy plateaus well before this many characters.
+LANGUAGE_DETECT_SAMPLE = 2048
+
+
+def detect_post_language(body: str) -> str:
+    """Return a supported language guessed from the start of ``body``."""
+    default = app.config['BABEL_DEFAULT_LOCALE']
+    try:
+        language = detect(body[:LANGUAGE_DETECT_SAMPLE])
+    except LangDetectException:
+        return default
+    return language if language in app.config['LANGUAGES'] else default
+
+
 @app.route('/post/new', methods=['GET', 'POST'])
 @login_required
 def create_post():
@@ -1657,25 +2517,14 @@ def create_post():
         language = request.form['language'].strip()
         comment = request.form.get('comment', '').strip()
         if language not in app.config['LANGUAGES']:
-            try:
-                language = detect(body)
-            except LangDetectException:
-                language = app.config['BABEL_DEFAULT_LOCALE']
-            if language not in app.config['LANGUAGES']:
-                language = app.config['BABEL_DEFAULT_LOCALE']
+            language = detect_post_language(body)
         if not path:
             path = generate_unique_path(title, language)
-        elif Post.query.filter_by(path=path, language=language).first():
+        elif path_taken(path, language):
             flash(_('Path already exists'))
             return redirect(url_for('create_post'))
         tag_names = [t.strip() for t in request.form['tags'].split(',') if t.strip()]
-        tags = []
-        for name in dict.fromkeys(tag_names):
-            tag = Tag.query.filter_by(name=name).first()
-            if not tag:
-                tag = Tag(name=name)
-                db.session.add(tag)
-            tags.append(tag)
+        tags = get_or_create_tags(tag_names)
         post = Post(title=title, body=body, path=path, language=language,
                     author=current_user, tags=tags)
         db.session.add(post)
@@ -1781,10 +2630,153 @@ def create_post():
     )
 
 
+# Metadata keys shown on the map rather than in the metadata table
+COORDINATE_META_KEYS = frozenset(
+    {'lat', 'lon', 'latitude', 'longitude', 'lng', 'locations'}
+)
+
+# Used to derive the BibTeX key on post pages
+_NON_WORD_RE = re.compile(r'\W+')
+META_DESCRIPTION_LENGTH = 160
+
+
+class _DescriptionParser(HTMLParser):
+    """Collect text from HTML until enough for a meta description is seen."""
+
+    class Done(Exception):
+        pass
+
+    def __init__(self, limit: int) -> None:
+        super().__init__()
+        self.limit = limit
+        self.parts: list[str] = []
+        # Length of the collected text with whitespace collapsed, kept up to
+        # date per chunk so the parts are only joined once, in ``text()``.
+        self.length = 0
+        self._in_word = False
+
+    def handle_data(self, data: str) -> None:
+        self.parts.append(data)
+        words = data.split()
+        if words:
+            if self._in_word and not data[0].isspace():
+                # The chunk continues the word the previous one ended in.
+                self.length += len(words.pop(0))
+            for word in words:
+                self.length += len(word) + (1 if self.length else 0)
+        if data:
+            self._in_word = not data[-1].isspace()
+        # One extra character makes the cut final.
+        if self.length > self.limit:
+            raise self.Done
+
+    def text(self) -> str:
+        return ' '.join(''.join(self.parts).split())
+
+
+@lru_cache(maxsize=MARKDOWN_CACHE_SIZE)
+def meta_description(html: str) -> str:
+    """Return the first 160 characters of ``html`` as collapsed plain text.
+
+    Parsing stops as soon as enough text has been collected, so long posts
+    are not stripped in full.
+    """
+    parser = _DescriptionParser(META_DESCRIPTION_LENGTH)
+    try:
+        parser.feed(html)
+        parser.close()
+    except _DescriptionParser.Done:
+        pass
+    return parser.text()[:META_DESCRIPTION_LENGTH]
+
+
+def post_bibtex(post_id: int, title: str, username: str, year: int, url: str) -> str:
+    """Return the ``@misc`` BibTeX entry shown on a post page."""
+    key = _NON_WORD_RE.sub('', f"{username}{year}{post_id}")
+    return (
+        f"@misc{{{key}, title={{ {title} }}, author={{ {username} }}, "
+        f"year={{ {year} }}, url={{ {url} }} }}"
+    )
+
+
+def notify_watchers(post: Post, message: str) -> None:
+    """Notify the post's watchers and author, except the current user.
+
+    Recipients are selected as a ``UNION`` of the watcher ids and the
+    author id, which also removes duplicates, and the notifications are
+    written by a single ``INSERT ... SELECT``.
+    """
+    link = url_for('post_detail', post_id=post.id)
+    recipients = union(
+        select(PostWatch.user_id.label('user_id')).where(
+            PostWatch.post_id == post.id
+        ),
+        select(literal(post.author_id).label('user_id')),
+    ).subquery()
+    db.session.execute(
+        insert(Notification).from_select(
+            ['user_id', 'message', 'link'],
+            select(
+                recipients.c.user_id, literal(message), literal(link)
+            ).where(recipients.c.user_id != current_user.id),
+        )
+    )
+
+
+def document_base_url(language: str) -> str:
+    """Return the document URL prefix for ``language``, built once per request."""
+    bases = g.setdefault('document_bases', {})
+    base = bases.get(language)
+    if base is None:
+        base = bases[language] = url_for('document', language=language, doc_path='')
+    return base
+
+
+def post_math_flags(post: Post) -> tuple[bool, bool]:
+    """Return ``(enable_mathjax, enable_parens)`` for ``post``.
+
+    Each is set when one of the post's tags is listed in the matching
+    ``mathjax_tags`` or ``paren_tags`` setting.
+    """
+    tag_names = {t.name.lower() for t in post.tags}
+    mathjax_tags = {
+        t.strip().lower()
+        for t in get_setting('mathjax_tags', '').split(',')
+        if t.strip()
+    }
+    paren_tags = {
+        t.strip().lower()
+        for t in get_setting('paren_tags', '').split(',')
+        if t.strip()
+    }
+    return bool(tag_names & mathjax_tags), bool(tag_names & paren_tags)
+
+
+def _load_post_for_display(post_id: int, with_translations: bool = False) -> Post:
+    """Load a post together with the relationships its page renders.
+
+    Called after the view counter commit, which expires the instance, so
+    metadata, tags and author come back in three queries instead of being
+    lazy-loaded one by one.  ``with_translations`` batches the other
+    language versions of the document into the same load.
+    """
+    options = [
+        selectinload(Post.metadata),
+        selectinload(Post.tags),
+        joinedload(Post.author),
+    ]
+    if with_translations:
+        options.append(selectinload(Post.translations))
+    return db.session.execute(
+        select(Post).options(*options).where(Post.id == post_id)
+    ).scalar_one()
+
+
 @app.route('/post/<int:post_id>')
 def post_detail(post_id: int):
     post = Post.query.get_or_404(post_id)
-    views = increment_view_count(post)
+    views = increment_view_count(post.id)
+    post = _load_post_for_display(post.id)
     first_rev = (
         Revision.query.filter_by(post_id=post.id)
         .order_by(Revision.created_at.asc())
@@ -1796,8 +2788,8 @@ def post_detail(post_id: int):
     post_lat = post.latitude
     post_lon = post.longitude
     address = None
-    if post_lat is not None and post_lon is not None:
-        address = reverse_geocode_coords(post_lat, post_lon)
+    has_point = post_lat is not None and post_lon is not None
+    if has_point:
         locations = [
             loc
             for loc in locations
@@ -1805,20 +2797,14 @@ def post_detail(post_id: int):
                 loc['lat'] == post_lat and loc['lon'] == post_lon
             )
         ]
-    location_list = []
-    for loc in locations:
-        name = reverse_geocode_coords(loc['lat'], loc['lon'])
-        location_list.append({'lat': loc['lat'], 'lon': loc['lon'], 'name': name})
+    # Reverse geocode the post's point and every location in the background
+    # while the remaining queries and the Markdown render run.
+    coords = [(loc['lat'], loc['lon']) for loc in locations]
+    if has_point:
+        coords.insert(0, (post_lat, post_lon))
+    geocode_futures = submit_reverse_geocodes(coords)
     geodata = extract_geodata(post_meta)
-    if (
-        post_lat is not None
-        and post_lon is not None
-        and not any(
-            feat.get('geometry', {}).get('type') == 'Point'
-            and feat.get('geometry', {}).get('coordinates') == [post_lon, post_lat]
-            for feat in geodata
-        )
-    ):
+    if has_point and (post_lon, post_lat) not in point_coordinates(geodata):
         geodata.append(
             {
                 'type': 'Feature',
@@ -1826,14 +2812,15 @@ def post_detail(post_id: int):
                 'properties': {},
             }
         )
-    meta_no_coords = post_meta.copy()
-    for key in ('lat', 'lon', 'latitude', 'longitude', 'lng', 'locations'):
-        meta_no_coords.pop(key, None)
+    meta_no_coords = {
+        k: v for k, v in post_meta.items() if k not in COORDINATE_META_KEYS
+    }
     if warning:
         flash(_(warning))
     user_meta = {}
     citations = (
         PostCitation.query.filter_by(post_id=post.id)
+        .options(joinedload(PostCitation.user))
         .order_by(PostCitation.created_at.desc())
         .all()
     )
@@ -1847,41 +2834,32 @@ def post_detail(post_id: int):
             UserPostCitation.query.filter_by(
                 post_id=post.id, user_id=current_user.id
             )
+            .options(joinedload(UserPostCitation.user))
             .order_by(UserPostCitation.created_at.desc())
             .all()
         )
-    tag_names = [t.name.lower() for t in post.tags]
-    mathjax_tags = [
-        t.strip().lower()
-        for t in get_setting('mathjax_tags', '').split(',')
-        if t.strip()
-    ]
-    paren_tags = [
-        t.strip().lower()
-        for t in get_setting('paren_tags', '').split(',')
-        if t.strip()
-    ]
-    enable_mathjax = bool(set(tag_names) & set(mathjax_tags))
-    enable_parens = bool(set(tag_names) & set(paren_tags))
-    base = url_for('document', language=post.language, doc_path='')
+    enable_mathjax, enable_parens = post_math_flags(post)
+    base = document_base_url(post.language)
     html_body, toc = render_markdown(
         post.body, base, with_toc=True, enable_mathjax=enable_parens
     )
+    names = [future.result() for future in geocode_futures]
+    if has_point:
+        address = names.pop(0)
+    location_list = [
+        {'lat': loc['lat'], 'lon': loc['lon'], 'name': name}
+        for loc, name in zip(locations, names)
+    ]
     enabled = True
     if current_user.is_authenticated:
         enabled = current_user.keyword_highlight_plugin
     if enabled:
-        html_body = Markup(
-            apply_keyword_highlight_plugin(str(html_body), post.language)
-        )
+        html_body = Markup(highlight_keywords(str(html_body), post.language))
     canonical_url = url_for('document', language=post.language, doc_path=post.path, _external=True)
-    plain = re.sub('<[^<]+?>', '', html_body)
-    meta_description = ' '.join(plain.split())[:160]
+    description = meta_description(str(html_body))
     year = created_at.year if created_at else datetime.utcnow().year
-    key = re.sub(r'\W+', '', f"{post.author.username}{year}{post.id}")
-    bibtex = (
-        f"@misc{{{key}, title={{ {post.title} }}, author={{ {post.author.username} }}, "
-        f"year={{ {year} }}, url={{ {canonical_url} }} }}"
+    bibtex = post_bibtex(
+        post.id, post.title, post.author.username, year, canonical_url
     )
     return render_template(
         'post_detail.html',
@@ -1901,7 +2879,7 @@ def post_detail(post_id: int):
         address=address,
         bibtex=bibtex,
         canonical_url=canonical_url,
-        meta_description=meta_description,
+        meta_description=description,
         mathjax_enabled=enable_mathjax,
     )
 
@@ -1923,10 +2901,15 @@ def post_backlinks(post_id: int):
 @login_required
 def watch_post(post_id: int):
     post = Post.query.get_or_404(post_id)
-    existing = PostWatch.query.filter_by(post_id=post.id, user_id=current_user.id).first()
-    if not existing:
+    if db.engine.dialect.name == 'sqlite':
+        db.session.execute(
+            sqlite_insert(PostWatch)
+            .values(post_id=post.id, user_id=current_user.id)
+            .on_conflict_do_nothing(index_elements=['post_id', 'user_id'])
+        )
+    elif not db.session.get(PostWatch, (post.id, current_user.id)):
         db.session.add(PostWatch(post_id=post.id, user_id=current_user.id))
-        db.session.commit()
+    db.session.commit()
     return redirect(url_for('post_detail', post_id=post.id))
 
 
@@ -1934,10 +2917,12 @@ def watch_post(post_id: int):
 @login_required
 def unwatch_post(post_id: int):
     post = Post.query.get_or_404(post_id)
-    watch = PostWatch.query.filter_by(post_id=post.id, user_id=current_user.id).first()
-    if watch:
-        db.session.delete(watch)
-        db.session.commit()
+    db.session.execute(
+        delete(PostWatch).where(
+            PostWatch.post_id == post.id, PostWatch.user_id == current_user.id
+        )
+    )
+    db.session.commit()
     return redirect(url_for('post_detail', post_id=post.id))
 
 
@@ -1969,14 +2954,26 @@ def delete_post(post_id: int):
 def document(language: str, doc_path: str):
     if language not in app.config['LANGUAGES']:
         abort(404)
-    post = Post.query.filter_by(language=language, path=doc_path).first()
-    if not post:
-        redirect_entry = Redirect.query.filter_by(
-            language=language, old_path=doc_path
-        ).first()
-        if redirect_entry:
+    # Resolve the post id or, failing that, a redirect target in one query.
+    found = db.session.execute(
+        union_all(
+            select(
+                literal(0).label('rank'),
+                Post.id.label('post_id'),
+                literal(None, String).label('new_path'),
+            ).where(Post.language == language, Post.path == doc_path),
+            select(
+                literal(1), literal(None, Integer), Redirect.new_path
+            ).where(Redirect.language == language, Redirect.old_path == doc_path),
+        )
+        .order_by(text('rank'))
+        .limit(1)
+    ).first()
+    post_id = found.post_id if found else None
+    if post_id is None:
+        if found:
             return redirect(
-                url_for('document', language=language, doc_path=redirect_entry.new_path)
+                url_for('document', language=language, doc_path=found.new_path)
             )
         title = doc_path.rsplit('/', 1)[-1]
         return redirect(
@@ -1987,7 +2984,8 @@ def document(language: str, doc_path: str):
                 language=language,
             )
         )
-    views = increment_view_count(post)
+    views = increment_view_count(post_id)
+    post = _load_post_for_display(post_id, with_translations=True)
     first_rev = (
         Revision.query.filter_by(post_id=post.id)
         .order_by(Revision.created_at.asc())
@@ -1999,8 +2997,8 @@ def document(language: str, doc_path: str):
     post_lat = post.latitude
     post_lon = post.longitude
     address = None
-    if post_lat is not None and post_lon is not None:
-        address = reverse_geocode_coords(post_lat, post_lon)
+    has_point = post_lat is not None and post_lon is not None
+    if has_point:
         locations = [
             loc
             for loc in locations
@@ -2008,20 +3006,14 @@ def document(language: str, doc_path: str):
                 loc['lat'] == post_lat and loc['lon'] == post_lon
             )
         ]
-    location_list = []
-    for loc in locations:
-        name = reverse_geocode_coords(loc['lat'], loc['lon'])
-        location_list.append({'lat': loc['lat'], 'lon': loc['lon'], 'name': name})
+    # Reverse geocode the post's point and every location in the background
+    # while the remaining queries and the Markdown render run.
+    coords = [(loc['lat'], loc['lon']) for loc in locations]
+    if has_point:
+        coords.insert(0, (post_lat, post_lon))
+    geocode_futures = submit_reverse_geocodes(coords)
     geodata = extract_geodata(post_meta)
-    if (
-        post_lat is not None
-        and post_lon is not None
-        and not any(
-            feat.get('geometry', {}).get('type') == 'Point'
-            and feat.get('geometry', {}).get('coordinates') == [post_lon, post_lat]
-            for feat in geodata
-        )
-    ):
+    if has_point and (post_lon, post_lat) not in point_coordinates(geodata):
         geodata.append(
             {
                 'type': 'Feature',
@@ -2029,14 +3021,15 @@ def document(language: str, doc_path: str):
                 'properties': {},
             }
         )
-    meta_no_coords = post_meta.copy()
-    for key in ('lat', 'lon', 'latitude', 'longitude', 'lng', 'locations'):
-        meta_no_coords.pop(key, None)
+    meta_no_coords = {
+        k: v for k, v in post_meta.items() if k not in COORDINATE_META_KEYS
+    }
     if warning:
         flash(_(warning))
     user_meta = {}
     citations = (
         PostCitation.query.filter_by(post_id=post.id)
+        .options(joinedload(PostCitation.user))
         .order_by(PostCitation.created_at.desc())
         .all()
     )
@@ -2050,29 +3043,23 @@ def document(language: str, doc_path: str):
             UserPostCitation.query.filter_by(
                 post_id=post.id, user_id=current_user.id
             )
+            .options(joinedload(UserPostCitation.user))
             .order_by(UserPostCitation.created_at.desc())
             .all()
         )
-    tag_names = [t.name.lower() for t in post.tags]
-    mathjax_tags = [
-        t.strip().lower()
-        for t in get_setting('mathjax_tags', '').split(',')
-        if t.strip()
-    ]
-    paren_tags = [
-        t.strip().lower()
-        for t in get_setting('paren_tags', '').split(',')
-        if t.strip()
-    ]
-    enable_mathjax = bool(set(tag_names) & set(mathjax_tags))
-    enable_parens = bool(set(tag_names) & set(paren_tags))
-    base = url_for('document', language=language, doc_path='')
+    enable_mathjax, enable_parens = post_math_flags(post)
+    base = document_base_url(language)
     html_body, toc = render_markdown(
         post.body, base, with_toc=True, enable_mathjax=enable_parens
     )
-    translations = Post.query.filter(
-        Post.path == doc_path, Post.language != language
-    ).all()
+    names = [future.result() for future in geocode_futures]
+    if has_point:
+        address = names.pop(0)
+    location_list = [
+        {'lat': loc['lat'], 'lon': loc['lon'], 'name': name}
+        for loc, name in zip(locations, names)
+    ]
+    translations = [t for t in post.translations if t.language != language]
     return render_template(
         'post_detail.html',
         post=post,
@@ -2106,13 +3093,13 @@ def markdown_preview():
     data = request.get_json() or {}
     text = data.get('text', '')
     language = data.get('language', 'en')
-    base = url_for('document', language=language, doc_path='')
+    base = document_base_url(language)
     html, _ = render_markdown(text, base)
     enabled = True
     if current_user.is_authenticated:
         enabled = current_user.keyword_highlight_plugin
     if enabled:
-        html = Markup(apply_keyword_highlight_plugin(str(html), language))
+        html = Markup(highlight_keywords(str(html), language))
     return {'html': str(Markup(html))}
 
 
@@ -2178,6 +3165,30 @@ def fetch_citation():
     return {'part': entry, 'text': bibtex}
 
 
+def citation_exists(
+    post_id: int,
+    doi: str | None = None,
+    text: str | None = None,
+    exclude_id: int | None = None,
+) -> bool:
+    """Return whether a shared or user citation on the post matches.
+
+    Matches on ``doi`` when given, otherwise on the citation ``text``.
+    Both citation tables are probed in one ``UNION ALL`` round trip.
+    """
+    probes = []
+    for model in (PostCitation, UserPostCitation):
+        if doi is not None:
+            match = model.doi == doi
+        else:
+            match = model.citation_text == text
+        probe = select(model.id).where(model.post_id == post_id, match)
+        if exclude_id is not None:
+            probe = probe.where(model.id != exclude_id)
+        probes.append(probe)
+    return db.session.scalar(union_all(*probes).limit(1)) is not None
+
+
 @app.route('/post/<int:post_id>/citation/new', methods=['POST'])
 @login_required
 def new_citation(post_id: int):
@@ -2204,17 +3215,11 @@ def new_citation(post_id: int):
             entry['doi'] = doi
     # Ensure uniqueness by DOI or citation text
     if doi:
-        existing = PostCitation.query.filter_by(post_id=post.id, doi=doi).first()
-        if not existing:
-            existing = UserPostCitation.query.filter_by(post_id=post.id, doi=doi).first()
-        if existing:
+        if citation_exists(post.id, doi=doi):
             flash(_('Citation with this DOI already exists.'))
             return redirect(url_for('post_detail', post_id=post.id))
     else:
-        existing = PostCitation.query.filter_by(post_id=post.id, citation_text=text).first()
-        if not existing:
-            existing = UserPostCitation.query.filter_by(post_id=post.id, citation_text=text).first()
-        if existing:
+        if citation_exists(post.id, text=text):
             flash(_('Citation with this text already exists.'))
             return redirect(url_for('post_detail', post_id=post.id))
     if current_user.id == post.author_id or current_user.is_admin():
@@ -2240,15 +3245,7 @@ def new_citation(post_id: int):
             bibtex_fields=entry,
         )
     db.session.add(citation)
-    watcher_ids = {
-        w.user_id for w in PostWatch.query.filter_by(post_id=post.id).all()
-    }
-    watcher_ids.add(post.author_id)
-    link = url_for('post_detail', post_id=post.id)
-    for uid in watcher_ids:
-        if uid != current_user.id:
-            msg = _('Citation added to "%(title)s".', title=post.title)
-            db.session.add(Notification(user_id=uid, message=msg, link=link))
+    notify_watchers(post, _('Citation added to "%(title)s".', title=post.title))
     db.session.commit()
     return redirect(url_for('post_detail', post_id=post.id))
 
@@ -2284,35 +3281,11 @@ def edit_citation(post_id: int, cid: int):
             doi = normalize_doi(entry.get('doi'))
             if doi:
                 entry['doi'] = doi
-                existing = (
-                    PostCitation.query.filter(
-                        PostCitation.post_id == post.id,
-                        PostCitation.doi == doi,
-                        PostCitation.id != citation.id,
-                    ).first()
-                    or UserPostCitation.query.filter(
-                        UserPostCitation.post_id == post.id,
-                        UserPostCitation.doi == doi,
-                        UserPostCitation.id != citation.id,
-                    ).first()
-                )
-                if existing:
+                if citation_exists(post.id, doi=doi, exclude_id=citation.id):
                     flash(_('Citation with this DOI already exists.'))
                     return redirect(url_for('edit_citation', post_id=post.id, cid=cid))
         if doi is None:
-            existing = (
-                PostCitation.query.filter(
-                    PostCitation.post_id == post.id,
-                    PostCitation.citation_text == text,
-                    PostCitation.id != citation.id,
-                ).first()
-                or UserPostCitation.query.filter(
-                    UserPostCitation.post_id == post.id,
-                    UserPostCitation.citation_text == text,
-                    UserPostCitation.id != citation.id,
-                ).first()
-            )
-            if existing:
+            if citation_exists(post.id, text=text, exclude_id=citation.id):
                 flash(_('Citation with this text already exists.'))
                 return redirect(url_for('edit_citation', post_id=post.id, cid=cid))
         citation.citation_part = entry
@@ -2321,15 +3294,7 @@ def edit_citation(post_id: int, cid: int):
         citation.doi = doi
         citation.bibtex_raw = text
         citation.bibtex_fields = entry
-        watcher_ids = {
-            w.user_id for w in PostWatch.query.filter_by(post_id=post.id).all()
-        }
-        watcher_ids.add(post.author_id)
-        link = url_for('post_detail', post_id=post.id)
-        for uid in watcher_ids:
-            if uid != current_user.id:
-                msg = _('Citation updated on "%(title)s".', title=post.title)
-                db.session.add(Notification(user_id=uid, message=msg, link=link))
+        notify_watchers(post, _('Citation updated on "%(title)s".', title=post.title))
         db.session.commit()
         return redirect(url_for('post_detail', post_id=post.id))
     part_json = json.dumps(citation.citation_part)
@@ -2348,15 +3313,7 @@ def delete_citation(post_id: int, cid: int):
         flash(_('Permission denied.'))
         return redirect(url_for('post_detail', post_id=post.id))
     db.session.delete(citation)
-    watcher_ids = {
-        w.user_id for w in PostWatch.query.filter_by(post_id=post.id).all()
-    }
-    watcher_ids.add(post.author_id)
-    link = url_for('post_detail', post_id=post.id)
-    for uid in watcher_ids:
-        if uid != current_user.id:
-            msg = _('Citation deleted from "%(title)s".', title=post.title)
-            db.session.add(Notification(user_id=uid, message=msg, link=link))
+    notify_watchers(post, _('Citation deleted from "%(title)s".', title=post.title))
     db.session.commit()
     return redirect(url_for('post_detail', post_id=post.id))
 
@@ -2384,9 +3341,7 @@ def edit_post(post_id: int):
             new_path = generate_unique_path(post.title, new_language)
         elif (
             (new_path != old_path or new_language != old_language)
-            and Post.query.filter_by(path=new_path, language=new_language)
-            .filter(Post.id != post.id)
-            .first()
+            and path_taken(new_path, new_language, exclude_id=post.id)
         ):
             flash(_('Path already exists'))
             return redirect(url_for('edit_post', post_id=post.id))
@@ -2397,13 +3352,7 @@ def edit_post(post_id: int):
                 Redirect(old_path=old_path, new_path=post.path, language=old_language)
             )
         tag_names = [t.strip() for t in request.form['tags'].split(',') if t.strip()]
-        post.tags = []
-        for name in dict.fromkeys(tag_names):
-            tag = Tag.query.filter_by(name=name).first()
-            if not tag:
-                tag = Tag(name=name)
-                db.session.add(tag)
-            post.tags.append(tag)
+        post.tags = get_or_create_tags(tag_names)
         metadata_json = request.form.get('metadata', '').strip()
         user_metadata_json = request.form.get('user_metadata', '').strip()
 
@@ -2449,18 +3398,7 @@ def edit_post(post_id: int):
             post.latitude = None
             post.longitude = None
 
-        current_views = PostMetadata.query.filter_by(post_id=post.id, key='views').first()
-
-        PostMetadata.query.filter(
-            PostMetadata.post_id == post.id,
-            PostMetadata.key != 'views',
-        ).delete(synchronize_session=False)
-
-        for key, value in meta_dict.items():
-            db.session.add(PostMetadata(post=post, key=key, value=value))
-
-        if not current_views:
-            db.session.add(PostMetadata(post=post, key='views', value='0'))
+        replace_post_metadata(post, meta_dict)
         if user_metadata_json:
             try:
                 user_meta_dict = json.loads(user_metadata_json)
@@ -2475,15 +3413,7 @@ def edit_post(post_id: int):
         else:
             UserPostMetadata.query.filter_by(post_id=post.id, user_id=current_user.id).delete()
         update_post_links(post)
-        watcher_ids = {
-            w.user_id for w in PostWatch.query.filter_by(post_id=post.id).all()
-        }
-        watcher_ids.add(post.author_id)
-        link = url_for('post_detail', post_id=post.id)
-        for uid in watcher_ids:
-            if uid != current_user.id:
-                msg = _('Post "%(title)s" was updated.', title=post.title)
-                db.session.add(Notification(user_id=uid, message=msg, link=link))
+        notify_watchers(post, _('Post "%(title)s" was updated.', title=post.title))
         rev.byte_change = len(post.body) - len(old_body)
         db.session.commit()
         return redirect(url_for('document', language=post.language, doc_path=post.path))
@@ -2507,20 +3437,53 @@ def history(post_id: int):
     return render_template('history.html', post=post, revisions=revisions)
 
 
+REVISION_DIFF_CACHE_SIZE = 256
+_revision_diff_memo: OrderedDict[tuple[int, bytes, bytes], str] = OrderedDict()
+_revision_diff_memo_lock = threading.Lock()
+
+
+def revision_diff_text(revision: Revision, current_body: str) -> str:
+    """Return the unified diff between ``revision`` and ``current_body``.
+
+    Identical bodies short-circuit to an empty diff. Other results are
+    memoized on the revision id and digests of both bodies, so repeated
+    views of the same diff skip ``difflib`` without holding the bodies.
+    """
+    if revision.body == current_body:
+        return ''
+    key = (
+        revision.id,
+        hashlib.blake2b(revision.body.encode(), digest_size=16).digest(),
+        hashlib.blake2b(current_body.encode(), digest_size=16).digest(),
+    )
+    with _revision_diff_memo_lock:
+        diff = _revision_diff_memo.get(key)
+        if diff is not None:
+            _revision_diff_memo.move_to_end(key)
+            return diff
+    diff = '\n'.join(
+        difflib.unified_diff(
+            revision.body.splitlines(),
+            current_body.splitlines(),
+            fromfile=f'rev {revision.id}',
+            tofile='current',
+            lineterm='',
+        )
+    )
+    with _revision_diff_memo_lock:
+        _revision_diff_memo[key] = diff
+        while len(_revision_diff_memo) > REVISION_DIFF_CACHE_SIZE:
+            _revision_diff_memo.popitem(last=False)
+    return diff
+
+
 @app.route('/post/<int:post_id>/diff/<int:rev_id>')
 def revision_diff(post_id: int, rev_id: int):
     post = Post.query.get(post_id)
     revision = Revision.query.get_or_404(rev_id)
     if post and revision.post_id != post.id:
         abort(404)
-    current_body = post.body if post else ''
-    diff = difflib.unified_diff(
-        revision.body.splitlines(),
-        current_body.splitlines(),
-        fromfile=f'rev {revision.id}',
-        tofile='current',
-        lineterm='',
-    )
+    diff = revision_diff_text(revision, post.body if post else '')
     post_exists = post is not None
     if not post_exists:
         post = SimpleNamespace(id=post_id, title=revision.title)
@@ -2528,7 +3491,7 @@ def revision_diff(post_id: int, rev_id: int):
         'diff.html',
         post=post,
         revision=revision,
-        diff='\n'.join(diff),
+        diff=diff,
         post_exists=post_exists,
     )
 
@@ -2560,15 +3523,7 @@ def revert_revision(post_id: int, rev_id: int):
     post.path = revision.path
     post.language = revision.language
 
-    watcher_ids = {
-        w.user_id for w in PostWatch.query.filter_by(post_id=post.id).all()
-    }
-    watcher_ids.add(post.author_id)
-    link = url_for('post_detail', post_id=post.id)
-    for uid in watcher_ids:
-        if uid != current_user.id:
-            msg = _('Post "%(title)s" was updated.', title=post.title)
-            db.session.add(Notification(user_id=uid, message=msg, link=link))
+    notify_watchers(post, _('Post "%(title)s" was updated.', title=post.title))
 
     db.session.commit()
     flash(_('Post reverted.'))
@@ -2639,35 +3594,31 @@ def admin_db_status():
 def admin_stats_posts_over_time():
     if not current_user.is_admin():
         abort(403)
-    daily = (
-        db.session.query(func.strftime('%Y-%m-%d', Post.created_at), func.count())
-        .group_by(func.strftime('%Y-%m-%d', Post.created_at))
-        .order_by(func.strftime('%Y-%m-%d', Post.created_at))
-        .all()
-    )
-    weekly = (
-        db.session.query(func.strftime('%Y-%W', Post.created_at), func.count())
-        .group_by(func.strftime('%Y-%W', Post.created_at))
-        .order_by(func.strftime('%Y-%W', Post.created_at))
-        .all()
-    )
-    monthly = (
-        db.session.query(func.strftime('%Y-%m', Post.created_at), func.count())
-        .group_by(func.strftime('%Y-%m', Post.created_at))
-        .order_by(func.strftime('%Y-%m', Post.created_at))
-        .all()
-    )
-    yearly = (
-        db.session.query(func.strftime('%Y', Post.created_at), func.count())
-        .group_by(func.strftime('%Y', Post.created_at))
-        .order_by(func.strftime('%Y', Post.created_at))
-        .all()
-    )
+    # One scan grouped by day; coarser periods are rolled up from the days.
+    day = func.strftime('%Y-%m-%d', Post.created_at)
+    daily = db.session.query(day, func.count()).group_by(day).order_by(day).all()
+    weekly, monthly, yearly = Counter(), Counter(), Counter()
+    for period, count in daily:
+        if period is None:
+            weekly[None] += count
+            monthly[None] += count
+            yearly[None] += count
+            continue
+        weekly[datetime.strptime(period, '%Y-%m-%d').strftime('%Y-%W')] += count
+        monthly[period[:7]] += count
+        yearly[period[:4]] += count
+
+    def series(counts):
+        return [
+            {'period': p, 'count': c}
+            for p, c in sorted(counts.items(), key=lambda i: (i[0] is not None, i[0] or ''))
+        ]
+
     result = {
         'daily': [{'period': d, 'count': c} for d, c in daily],
-        'weekly': [{'period': w, 'count': c} for w, c in weekly],
-        'monthly': [{'period': m, 'count': c} for m, c in monthly],
-        'yearly': [{'period': y, 'count': c} for y, c in yearly],
+        'weekly': series(weekly),
+        'monthly': series(monthly),
+        'yearly': series(yearly),
     }
     return jsonify(result)
 
@@ -2688,190 +3639,256 @@ def admin_view_stats_top_posts():
     if not current_user.is_admin():
         abort(403)
     now = datetime.utcnow()
-    def top_since(delta):
-        start = now - delta
-        data = (
-            db.session.query(Post.title, func.count(PostView.id).label('views'))
-            .select_from(PostView)
-            .join(Post)
-            .filter(PostView.viewed_at >= start)
-            .group_by(Post.id)
-            .order_by(func.count(PostView.id).desc())
-            .limit(5)
-            .all()
-        )
-        return [{'title': title, 'views': views} for title, views in data]
-    result = {
-        'daily': top_since(timedelta(days=1)),
-        'weekly': top_since(timedelta(days=7)),
-        'monthly': top_since(timedelta(days=30)),
-        'yearly': top_since(timedelta(days=365)),
+    windows = {
+        'daily': now - timedelta(days=1),
+        'weekly': now - timedelta(days=7),
+        'monthly': now - timedelta(days=30),
+        'yearly': now - timedelta(days=365),
     }
+    # One pass over the last year's views counts every window at once.
+    rows = (
+        db.session.query(
+            Post.id,
+            Post.title,
+            *(
+                func.sum(case((PostView.viewed_at >= start, 1), else_=0)).label(name)
+                for name, start in windows.items()
+            ),
+        )
+        .select_from(PostView)
+        .join(Post)
+        .filter(PostView.viewed_at >= windows['yearly'])
+        .group_by(Post.id)
+        .all()
+    )
+    result = {}
+    for name in windows:
+        ranked = sorted(
+            (row for row in rows if getattr(row, name)),
+            key=lambda row: (-getattr(row, name), row.id),
+        )
+        result[name] = [
+            {'title': row.title, 'views': getattr(row, name)} for row in ranked[:5]
+        ]
     return jsonify(result)
 
 
+def _comma_list_setting(value: str) -> str:
+    return ','.join(t.strip() for t in value.split(',') if t.strip())
+
+
+def _lines_setting(value: str) -> str:
+    return "\n".join(line.strip() for line in value.splitlines() if line.strip())
+
+
+def _category_json_setting(value: str) -> str | None:
+    """Return the category mapping in compact form or ``None`` if invalid.
+
+    Anything that is not an object or array is rejected before parsing.
+    """
+    if not value:
+        return value
+    if value[0] not in '{[':
+        return None
+    try:
+        return to_json(from_json(value))
+    except json.JSONDecodeError:
+        return None
+
+
+# Settings edited on the settings page as ``(key, default, normalize, error)``.
+# Submitted values are stripped and fall back to ``default`` when empty;
+# ``normalize`` returns ``None`` for invalid input, which is reported with
+# ``error``. The keys double as the template variable names.
+SETTINGS_FIELDS = (
+    ('site_title', '', None, None),
+    ('site_title_style', '', None, None),
+    ('home_page_path', '', None, None),
+    ('timezone', 'UTC', normalize_timezone, lazy_gettext('Invalid timezone')),
+    ('rss_limit', '20', None, None),
+    ('head_tags', '', _lines_setting, None),
+    (
+        'post_categories',
+        '',
+        _category_json_setting,
+        lazy_gettext('Invalid category JSON'),
+    ),
+    ('breadcrumb_limit', '10', None, None),
+    ('mathjax_tags', '', _comma_list_setting, None),
+    ('paren_tags', '', _comma_list_setting, None),
+)
+# Only saved when present in the submitted form.
+SETTINGS_OPTIONAL_FIELDS = frozenset({'home_page_path', 'timezone'})
+
+
 @app.route('/settings', methods=['GET', 'POST'])
 @login_required
 def settings():
     if not current_user.is_admin():
         abort(403)
-    title = get_setting('site_title', '')
-    title_style = get_setting('site_title_style', '')
-    home_page = get_setting('home_page_path', '')
-    timezone_value = get_setting('timezone', 'UTC')
+    values = {key: get_setting(key, default) for key, default, _n, _e in SETTINGS_FIELDS}
     rss_enabled_val = get_setting('rss_enabled', 'false')
-    rss_limit = get_setting('rss_limit', '20')
-    head_tags = get_setting('head_tags', '')
-    category_tags = get_setting('post_categories', '')
-    breadcrumb_limit = get_setting('breadcrumb_limit', '10')
-    mathjax_tags_val = get_setting('mathjax_tags', '')
-    paren_tags_val = get_setting('paren_tags', '')
     if request.method == 'POST':
-
-        title = request.form.get('site_title', title).strip()
-        title_style = request.form.get('site_title_style', title_style).strip()
-        home_page = request.form.get('home_page_path', home_page).strip()
-        tz_input = request.form.get('timezone', timezone_value).strip() or 'UTC'
-        tz_norm = normalize_timezone(tz_input)
-        if tz_norm is None:
-            flash(_('Invalid timezone'))
-            return redirect(url_for('settings'))
-        timezone_value = tz_norm
-        rss_enabled_val = 'rss_enabled' in request.form
-        rss_limit = request.form.get('rss_limit', rss_limit).strip() or '20'
-        breadcrumb_limit = request.form.get('breadcrumb_limit', breadcrumb_limit).strip() or '10'
-        head_tags_input = request.form.get('head_tags', head_tags)
-        head_tags = "\n".join(line.strip() for line in head_tags_input.splitlines() if line.strip())
-        category_tags = request.form.get('post_categories', category_tags).strip()
-        mathjax_tags_val = request.form.get('mathjax_tags', mathjax_tags_val)
-        mathjax_tags_val = ','.join(
-            t.strip() for t in mathjax_tags_val.split(',') if t.strip()
-        )
-        paren_tags_val = request.form.get('paren_tags', paren_tags_val)
-        paren_tags_val = ','.join(
-            t.strip() for t in paren_tags_val.split(',') if t.strip()
-        )
-        # Validate category mapping JSON
-        try:
-            if category_tags:
-                json.loads(category_tags)
-        except json.JSONDecodeError:
-            flash(_('Invalid category JSON'))
-            return redirect(url_for('settings'))
-
-        title_setting = Setting.query.filter_by(key='site_title').first()
-        if title_setting:
-            title_setting.value = title
-        else:
-            title_setting = Setting(key='site_title', value=title)
-            db.session.add(title_setting)
-
-        style_setting = Setting.query.filter_by(key='site_title_style').first()
-        if style_setting:
-            style_setting.value = title_style
-        else:
-            db.session.add(Setting(key='site_title_style', value=title_style))
-
-        if 'home_page_path' in request.form:
-            home_page = request.form['home_page_path'].strip()
-            home_setting = Setting.query.filter_by(key='home_page_path').first()
-            if home_setting:
-                home_setting.value = home_page
-            else:
-                db.session.add(Setting(key='home_page_path', value=home_page))
-
-        if 'timezone' in request.form:
-            tz_setting = Setting.query.filter_by(key='timezone').first()
-            if tz_setting:
-                tz_setting.value = timezone_value
+        form = request.form
+        new_values = {}
+        for key, default, normalize, error in SETTINGS_FIELDS:
+            value = form.get(key, values[key]).strip() or default
+            if normalize is not None:
+                value = normalize(value)
+                if value is None:
+                    flash(str(error))
+                    return redirect(url_for('settings'))
+            if key in form or key not in SETTINGS_OPTIONAL_FIELDS:
+                new_values[key] = value
+        new_values['rss_enabled'] = 'true' if 'rss_enabled' in form else 'false'
+
+        existing = {
+            s.key: s for s in Setting.query.filter(Setting.key.in_(new_values))
+        }
+        for key, value in new_values.items():
+            setting = existing.get(key)
+            if setting:
+                setting.value = value
             else:
-                db.session.add(Setting(key='timezone', value=timezone_value))
-
-        rss_setting = Setting.query.filter_by(key='rss_enabled').first()
-        rss_value = 'true' if rss_enabled_val else 'false'
-        if rss_setting:
-            rss_setting.value = rss_value
-        else:
-            db.session.add(Setting(key='rss_enabled', value=rss_value))
-
-        limit_setting = Setting.query.filter_by(key='rss_limit').first()
-        if limit_setting:
-            limit_setting.value = rss_limit
-        else:
-            db.session.add(Setting(key='rss_limit', value=rss_limit))
-        head_setting = Setting.query.filter_by(key='head_tags').first()
-        if head_setting:
-            head_setting.value = head_tags
-        else:
-            db.session.add(Setting(key='head_tags', value=head_tags))
-        cat_setting = Setting.query.filter_by(key='post_categories').first()
-        if cat_setting:
-            cat_setting.value = category_tags
-        else:
-            db.session.add(Setting(key='post_categories', value=category_tags))
-        breadcrumb_setting = Setting.query.filter_by(key='breadcrumb_limit').first()
-        if breadcrumb_setting:
-            breadcrumb_setting.value = breadcrumb_limit
-        else:
-            db.session.add(Setting(key='breadcrumb_limit', value=breadcrumb_limit))
-        mathjax_setting = Setting.query.filter_by(key='mathjax_tags').first()
-        if mathjax_setting:
-            mathjax_setting.value = mathjax_tags_val
-        else:
-            db.session.add(Setting(key='mathjax_tags', value=mathjax_tags_val))
-        paren_setting = Setting.query.filter_by(key='paren_tags').first()
-        if paren_setting:
-            paren_setting.value = paren_tags_val
-        else:
-            db.session.add(Setting(key='paren_tags', value=paren_tags_val))
+                db.session.add(Setting(key=key, value=value))
 
         db.session.commit()
         flash(_('Settings updated.'))
         return redirect(url_for('settings'))
     return render_template(
         'settings.html',
-        site_title=title,
-        site_title_style=title_style,
-        home_page_path=home_page,
-        timezone=timezone_value,
         rss_enabled=rss_enabled_val.lower() in ['true', '1', 'yes', 'on'],
-        rss_limit=rss_limit,
-        head_tags=head_tags,
-        post_categories=category_tags,
-        breadcrumb_limit=breadcrumb_limit,
-        mathjax_tags=mathjax_tags_val,
-        paren_tags=paren_tags_val,
+        **values,
     )
 
 
+EARTH_RADIUS_KM = 6371
+
+
+def great_circle_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the haversine distance in km between two points."""
+    p1 = math.radians(lat1)
+    p2 = math.radians(lat2)
+    dphi = p2 - p1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def bounding_box(
+    lat: float, lon: float, radius: float
+) -> tuple[float, float, float | None, float | None]:
+    """Return ``(min_lat, max_lat, min_lon, max_lon)`` enclosing a circle.
+
+    Every point within ``radius`` km of ``(lat, lon)`` lies inside the box.
+    The longitude bounds are ``None`` when the circle reaches a pole or
+    crosses the antimeridian, where a single longitude range cannot hold it.
+    """
+    # A hair of slack keeps points exactly on the circle inside the box
+    # despite rounding differences with the distance calculation.
+    angular = radius / EARTH_RADIUS_KM * (1 + 1e-9)
+    dlat = math.degrees(angular)
+    min_lat, max_lat = lat - dlat, lat + dlat
+    cos_lat = math.cos(math.radians(lat))
+    if angular >= math.pi / 2 or min_lat <= -90 or max_lat >= 90 or math.sin(angular) >= cos_lat:
+        return min_lat, max_lat, None, None
+    dlon = math.degrees(math.asin(math.sin(angular) / cos_lat))
+    min_lon, max_lon = lon - dlon, lon + dlon
+    if min_lon < -180 or max_lon > 180:
+        return min_lat, max_lat, None, None
+    return min_lat, max_lat, min_lon, max_lon
+
+
+def haversine_km(
+    lat: float, lon: float, lats: list[float], lons: list[float]
+) -> list[float]:
+    """Return great-circle distances in km from one point to many.
+
+    Uses NumPy broadcasting when available so the trigonometry for all
+    points runs in a single vectorized pass.
+    """
+    if not lats:
+        return []
+    if np is not None:
+        p1 = np.radians(lat)
+        p2 = np.radians(np.asarray(lats, dtype=float))
+        dphi = p2 - p1
+        dlambda = np.radians(np.asarray(lons, dtype=float) - lon)
+        a = np.sin(dphi / 2) ** 2 + np.cos(p1) * np.cos(p2) * np.sin(dlambda / 2) ** 2
+        return (2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))).tolist()
+    return [great_circle_km(lat, lon, plat, plon) for plat, plon in zip(lats, lons)]
+
+
+def _tag_post_facts(
+    p: Post, meta: dict[str, str]
+) -> tuple[int, float | None, float | None, str]:
+    """Return the views, coordinates and snippet used to rank ``p`` on /tags.
+
+    ``meta`` is the post's metadata as a ``key -> value`` mapping.
+    """
+    views = int(meta.get('views', 0))
+    plat, plon = p.latitude, p.longitude
+    if plat is None or plon is None:
+        plat = meta.get('lat') or meta.get('latitude')
+        plon = meta.get('lon') or meta.get('longitude')
+        if plat is not None and plon is not None:
+            try:
+                plat = float(plat)
+                plon = float(plon)
+            except ValueError:
+                plat = plon = None
+    snippet = (p.body[:150] + '...') if len(p.body) > 150 else p.body
+    return views, plat, plon, snippet
+
+
 @app.route('/tags')
 def tag_list():
     tags = (
         Tag.query.filter(~Tag.name.in_(['deleted', '[deleted]']))
+        .options(
+            selectinload(Tag.posts).options(joinedload(Post.author))
+        )
         .order_by(Tag.name)
         .all()
     )
+    # Metadata for every listed post is read as plain rows in one query
+    # rather than materialised as ORM objects per post.
+    post_ids = {p.id for tag in tags for p in tag.posts}
+    meta_by_post = defaultdict(dict)
+    if post_ids:
+        for post_id, key, value in db.session.execute(
+            select(PostMetadata.post_id, PostMetadata.key, PostMetadata.value).where(
+                PostMetadata.post_id.in_(post_ids)
+            )
+        ):
+            meta_by_post[post_id][key] = value
     tag_locations = []
     tag_posts_data = []
     location_counts = {}
+    # Posts usually carry several tags; their views, coordinates and
+    # snippet are worked out once for the whole page.
+    post_facts = {}
     for tag in tags:
-        coords = None
-        # Sort posts by ID so that coordinate selection is deterministic
-        for p in sorted(tag.posts, key=lambda p: p.id):
+        # One pass gathers every listed post with its ranking inputs; the
+        # tag's own point is the located post with the lowest id.
+        scored_posts = []
+        located = []
+        for p in tag.posts:
             if not p.title or not p.body:
                 continue
-            if p.latitude is not None and p.longitude is not None:
-                coords = (p.latitude, p.longitude)
-                break
-            meta = {m.key: m.value for m in p.metadata}
-            lat = meta.get('lat') or meta.get('latitude')
-            lon = meta.get('lon') or meta.get('longitude')
-            if lat is not None and lon is not None:
-                try:
-                    coords = (float(lat), float(lon))
-                    break
-                except ValueError:
-                    continue
+            facts = post_facts.get(p.id)
+            if facts is None:
+                facts = post_facts[p.id] = _tag_post_facts(
+                    p, meta_by_post.get(p.id, {})
+                )
+            views, plat, plon, snippet = facts
+            scored_posts.append([float('inf'), views, p, snippet])
+            if plat is not None and plon is not None:
+                located.append((scored_posts[-1], plat, plon))
+        coords = None
+        if located:
+            _entry, plat, plon = min(located, key=lambda item: item[0][2].id)
+            coords = (plat, plon)
         if coords is not None:
             lat, lon = coords
             key = (round(lat, 4), round(lon, 4))
@@ -2890,45 +3907,20 @@ def tag_list():
                     'url': url_for('tag_filter', name=tag.name),
                 }
             )
-        def haversine(lat1, lon1, lat2, lon2):
-            r = 6371
-            p1 = math.radians(lat1)
-            p2 = math.radians(lat2)
-            dphi = math.radians(lat2 - lat1)
-            dlambda = math.radians(lon2 - lon1)
-            a = (
-                math.sin(dphi / 2) ** 2
-                + math.cos(p1) * math.cos(p2) * math.sin(dlambda / 2) ** 2
-            )
-            return 2 * r * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        scored_posts = []
-        for p in tag.posts:
-            if not p.title or not p.body:
-                continue
-            views = get_view_count(p)
-            plat, plon = p.latitude, p.longitude
-            if plat is None or plon is None:
-                meta = {m.key: m.value for m in p.metadata}
-                plat = meta.get('lat') or meta.get('latitude')
-                plon = meta.get('lon') or meta.get('longitude')
-                if plat is not None and plon is not None:
-                    try:
-                        plat = float(plat)
-                        plon = float(plon)
-                    except ValueError:
-                        plat = plon = None
-            distance = (
-                haversine(lat, lon, plat, plon)
-                if coords is not None and plat is not None and plon is not None
-                else float('inf')
+            entries, lats, lons = map(list, zip(*located))
+            for entry, distance in zip(entries, haversine_km(lat, lon, lats, lons)):
+                entry[0] = distance
+
+        if coords is None:
+            # Without a point every distance is infinite, so ranking is by
+            # views alone; nlargest keeps ties in listing order like sort.
+            top_posts = heapq.nlargest(5, scored_posts, key=lambda x: x[1])
+        else:
+            top_posts = heapq.nsmallest(
+                5, scored_posts, key=lambda x: (0 if x[0] <= 100 else 1, -x[1], x[0])
             )
-            snippet = (p.body[:150] + '...') if len(p.body) > 150 else p.body
-            scored_posts.append((distance, views, p, snippet))
-
-        scored_posts.sort(key=lambda x: (0 if x[0] <= 100 else 1, -x[1], x[0]))
         posts_data = []
-        for distance, views, p, snippet in scored_posts[:5]:
+        for distance, views, p, snippet in top_posts:
             posts_data.append(
                 {
                     'title': p.display_title,
@@ -2939,8 +3931,8 @@ def tag_list():
                 }
             )
         tag_posts_data.append({'tag': tag.name, 'posts': posts_data})
-    tag_locations_json = json.dumps(tag_locations)
-    tag_posts_json = json.dumps(tag_posts_data)
+    tag_locations_json = to_json(tag_locations)
+    tag_posts_json = to_json(tag_posts_data)
     return render_template(
         'tag_list.html',
         tag_locations_json=tag_locations_json,
@@ -2963,7 +3955,7 @@ def tag_filter(name: str):
         Post.query.join(Post.tags)
         .filter(func.lower(Tag.name).in_(syns), Post.title != '', Post.body != '')
     )
-    pagination = query.order_by(Post.id.desc()).paginate(
+    pagination = query.options(*POST_LIST_OPTIONS).order_by(Post.id.desc()).paginate(
         page=page, per_page=20, error_out=False
     )
     return render_template(
@@ -2971,6 +3963,51 @@ def tag_filter(name: str):
     )
 
 
+class _ListPagination:
+    """Pagination over an already materialised page of results.
+
+    Mirrors the attributes of Flask-SQLAlchemy's pagination object used by
+    the templates.
+    """
+
+    __slots__ = (
+        'items', 'page', 'per_page', 'total', 'pages',
+        'has_prev', 'has_next', 'prev_num', 'next_num',
+    )
+
+    def __init__(self, items: list, page: int, per_page: int, total: int):
+        pages = -(-total // per_page) if per_page else 0
+        self.items = items
+        self.page = page
+        self.per_page = per_page
+        self.total = total
+        self.pages = pages
+        self.has_prev = page > 1
+        self.has_next = page < pages
+        self.prev_num = page - 1
+        self.next_num = page + 1
+
+    def iter_pages(self, *, left_edge=2, left_current=2, right_current=4, right_edge=2):
+        pages_end = self.pages + 1
+        if pages_end == 1:
+            return
+        left_end = min(1 + left_edge, pages_end)
+        yield from range(1, left_end)
+        if left_end == pages_end:
+            return
+        mid_start = max(left_end, self.page - left_current)
+        mid_end = min(self.page + right_current + 1, pages_end)
+        if mid_start - left_end > 0:
+            yield None
+        yield from range(mid_start, mid_end)
+        if mid_end == pages_end:
+            return
+        right_start = max(mid_end, pages_end - right_edge)
+        if right_start - mid_end > 0:
+            yield None
+        yield from range(right_start, pages_end)
+
+
 @app.route('/search')
 def search():
     q = request.args.get('q', '').strip()
@@ -2984,23 +4021,20 @@ def search():
     page = request.args.get('page', 1, type=int)
     per_page = current_app.config.get('SEARCH_RESULTS_PER_PAGE', 20)
 
-    # Gather distinct metadata keys for the dropdown and include title/path
-    meta_keys = [k for (k,) in db.session.query(PostMetadata.key).distinct().all()]
-    meta_keys = ['title', 'path'] + sorted(meta_keys)
-    all_tags = [t.name for t in Tag.query.order_by(Tag.name).all()]
+    # Gather distinct metadata keys for the dropdown and include title/path.
+    # Both lists are read as ordered scalar columns straight from indexes.
+    meta_keys = ['title', 'path'] + list(
+        db.session.scalars(
+            select(PostMetadata.key).distinct().order_by(PostMetadata.key)
+        )
+    )
+    all_tags = list(db.session.scalars(select(Tag.name).order_by(Tag.name)))
 
     posts_query = None
     examples = None
     if q:
         expanded_q = expand_with_synonyms(q)
-        ids = [
-            row[0]
-            for row in db.session.execute(
-                text('SELECT rowid FROM post_fts WHERE post_fts MATCH :q'),
-                {'q': expanded_q},
-            )
-        ]
-        posts_query = Post.query.filter(Post.id.in_(ids)) if ids else Post.query.filter(False)
+        posts_query = Post.query.filter(Post.id.in_(fts_post_ids(expanded_q)))
     elif key and value_raw:
         try:
             value = json.loads(value_raw)
@@ -3018,48 +4052,66 @@ def search():
         posts_query = Post.query
     else:
         # Provide example posts to illustrate expected input format
-        examples = Post.query.limit(5).all()
+        examples = Post.query.options(defer(Post.body)).limit(5).all()
     posts = None
     pagination = None
+    # Result rows show title, path, language and tags; the body is never
+    # rendered, so it is left unloaded.
+    result_options = (defer(Post.body), selectinload(Post.tags))
     if posts_query is not None:
         for name in tag_names:
             syns = get_tag_synonyms(name)
-            posts_query = posts_query.filter(
-                Post.tags.any(func.lower(Tag.name).in_(syns))
-            )
+            posts_query = posts_query.filter(Post.id.in_(tagged_post_ids(syns)))
 
         if lat is not None and lon is not None and radius is not None:
-            all_posts = posts_query.all()
-            filtered_posts = [
-                p
-                for p in all_posts
-                if p.latitude is not None
-                and p.longitude is not None
-                and geopy_distance((lat, lon), (p.latitude, p.longitude)).km <= radius
+            # A bounding box narrows the candidates in SQL; only their ids
+            # and coordinates enter Python, where exact distances for all of
+            # them are computed in one vectorized call.
+            min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius)
+            posts_query = posts_query.filter(
+                Post.latitude.between(min_lat, max_lat), Post.longitude.isnot(None)
+            )
+            if min_lon is not None:
+                posts_query = posts_query.filter(
+                    Post.longitude.between(min_lon, max_lon)
+                )
+            candidates = (
+                posts_query
+                .with_entities(Post.id, Post.latitude, Post.longitude)
+                .order_by(Post.id)
+                .all()
+            )
+            distances = haversine_km(
+                lat,
+                lon,
+                [c.latitude for c in candidates],
+                [c.longitude for c in candidates],
+            )
+            matched_ids = [
+                c.id for c, d in zip(candidates, distances) if d <= radius
             ]
-            total = len(filtered_posts)
+            total = len(matched_ids)
             start = (page - 1) * per_page
             end = start + per_page
-            items = filtered_posts[start:end]
-            pagination = SimpleNamespace(
-                items=items,
-                page=page,
-                per_page=per_page,
-                total=total,
-                pages=math.ceil(total / per_page) if per_page else 0,
-                has_prev=page > 1,
-                has_next=page < math.ceil(total / per_page),
-                prev_num=page - 1,
-                next_num=page + 1,
-            )
+            page_ids = matched_ids[start:end]
+            items = []
+            if page_ids:
+                by_id = {
+                    p.id: p
+                    for p in Post.query.options(*result_options).filter(
+                        Post.id.in_(page_ids)
+                    )
+                }
+                items = [by_id[pid] for pid in page_ids]
+            pagination = _ListPagination(items, page, per_page, total)
             posts = items
         else:
-            posts_query = posts_query.order_by(Post.id.desc())
+            posts_query = posts_query.options(*result_options).order_by(Post.id.desc())
             pagination = posts_query.paginate(page=page, per_page=per_page, error_out=False)
             posts = pagination.items
 
     coords_json = (
-        json.dumps([{'lat': p.latitude, 'lon': p.longitude} for p in posts])
+        to_json([{'lat': p.latitude, 'lon': p.longitude} for p in posts])
         if posts
         else '[]'
     )
@@ -3115,18 +4167,24 @@ def citation_stats():
     pagination = query.paginate(page=page, per_page=20, error_out=False)
     rows = pagination.items
 
-    post_ids = set()
-    for row in rows:
-        if row.post_ids:
-            post_ids.update(row.post_ids.split(','))
-
-    posts_by_id = {
-        p.id: p for p in Post.query.filter(Post.id.in_(post_ids)).all()
-    }
+    # Parse each group's ids once; every post on the page is then fetched
+    # in one query with only the columns the links need.
+    ids_by_row = [
+        [int(pid) for pid in row.post_ids.split(',')] if row.post_ids else []
+        for row in rows
+    ]
+    post_ids = set(chain.from_iterable(ids_by_row))
+    posts_by_id = {}
+    if post_ids:
+        posts_by_id = {
+            p.id: p
+            for p in Post.query.options(
+                load_only(Post.title, Post.path, Post.language)
+            ).filter(Post.id.in_(post_ids))
+        }
 
     stats = []
-    for row in rows:
-        ids = [int(pid) for pid in row.post_ids.split(',')] if row.post_ids else []
+    for row, ids in zip(rows, ids_by_row):
         posts_list = [posts_by_id[i] for i in ids if i in posts_by_id]
         stats.append(
             {
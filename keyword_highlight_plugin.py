@@ -1,56 +1,100 @@
 import re
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
 import yake
 
+_PARAGRAPH_RE = re.compile(r'<p>(.*?)</p>', re.DOTALL)
+_TAG_RE = re.compile('<[^<]+?>')
+_SENTENCE_RE = re.compile(r'[^.!?]+[.!?]?')
+
 
 def _insert_tags(html_content: str, spans: List[Tuple[int, int]]) -> str:
+    """Wrap the plain-text ``spans`` of ``html_content`` in highlight tags.
+
+    ``spans`` must be sorted and non-overlapping. Offsets count characters
+    outside tags. Runs of text and whole tags are copied as slices located
+    with ``str.find``; an opening tag goes after any tags preceding the
+    span's first character and a closing tag right after its last one.
+    """
     result: List[str] = []
+    end = len(html_content)
+    pos = 0
     plain_idx = 0
-    span_iter = iter(sorted(spans, key=lambda s: s[0]))
-    current = next(span_iter, None)
-    i = 0
-    while i < len(html_content):
-        if current and plain_idx == current[1]:
-            result.append('</strong></u>')
-            current = next(span_iter, None)
-            continue
-        if html_content[i] == '<':
-            j = html_content.find('>', i) + 1
-            result.append(html_content[i:j])
-            i = j
-            continue
-        if current and plain_idx == current[0]:
+
+    def copy_plain(count: int) -> None:
+        # Copy up to and including the next ``count`` plain characters,
+        # along with any tags in between.
+        nonlocal pos, plain_idx
+        while count > 0 and pos < end:
+            lt = html_content.find('<', pos)
+            if lt == -1:
+                lt = end
+            run = lt - pos
+            if run >= count:
+                result.append(html_content[pos:pos + count])
+                pos += count
+                plain_idx += count
+                return
+            result.append(html_content[pos:lt])
+            pos = lt
+            plain_idx += run
+            count -= run
+            copy_tags()
+
+    def copy_tags() -> None:
+        nonlocal pos
+        while pos < end and html_content[pos] == '<':
+            gt = html_content.find('>', pos)
+            stop = end if gt == -1 else gt + 1
+            result.append(html_content[pos:stop])
+            pos = stop
+
+    for start, stop in spans:
+        copy_plain(start - plain_idx)
+        copy_tags()
+        if pos < end:
             result.append('<u><strong>')
-        result.append(html_content[i])
-        plain_idx += 1
-        i += 1
-    if current and plain_idx == current[1]:
-        result.append('</strong></u>')
+        copy_plain(stop - plain_idx)
+        if plain_idx == stop:
+            result.append('</strong></u>')
+    result.append(html_content[pos:])
     return ''.join(result)
 
 
-def apply_keyword_highlight_plugin(html: str, language: str = 'en') -> str:
-    extractor = None
+@lru_cache(maxsize=8)
+def _extractor(language: str) -> yake.KeywordExtractor:
     try:
-        extractor = yake.KeywordExtractor(lan=language, n=1, top=1)
+        return yake.KeywordExtractor(lan=language, n=1, top=1)
     except Exception:
-        extractor = yake.KeywordExtractor(lan='en', n=1, top=1)
+        return yake.KeywordExtractor(lan='en', n=1, top=1)
+
 
+@lru_cache(maxsize=4096)
+def _keyword(language: str, text: str) -> Optional[str]:
+    """Return the top keyword of a paragraph, or ``None`` if none is found."""
+    try:
+        return _extractor(language).extract_keywords(text)[0][0]
+    except Exception:
+        return None
+
+
+def apply_keyword_highlight_plugin(html: str, language: str = 'en') -> str:
     def process(match: re.Match[str]) -> str:
         content = match.group(1)
-        text = re.sub('<[^<]+?>', '', content)
+        text = _TAG_RE.sub('', content)
         text = text.strip()
         if not text:
             return match.group(0)
-        try:
-            keyword = extractor.extract_keywords(text)[0][0]
-        except Exception:
+        keyword = _keyword(language, text)
+        if keyword is None:
             return match.group(0)
-        spans: List[Tuple[int, int]] = []
-        for m in re.finditer(r'[^.!?]+[.!?]?', text):
-            sent = m.group().strip()
-            if keyword.lower() in sent.lower():
-                spans.append((m.start(), m.end()))
+        # Sentences come out of finditer in order, as _insert_tags expects.
+        lowered = keyword.lower()
+        spans: List[Tuple[int, int]] = [
+            m.span()
+            for m in _SENTENCE_RE.finditer(text)
+            if lowered in m.group().lower()
+        ]
         if not spans:
             new_content = f'[{keyword}] {content}'
             return f'<p>{new_content}</p>'
@@ -58,4 +102,4 @@ def apply_keyword_highlight_plugin(html: str, language: str = 'en') -> str:
         new_content = f'[{keyword}] {highlighted}'
         return f'<p>{new_content}</p>'
 
-    return re.sub(r'<p>(.*?)</p>', process, html, flags=re.DOTALL)
+    return _PARAGRAPH_RE.sub(process, html)
@@ -58,6 +58,16 @@ class Post(db.Model):
     author_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
     author = db.relationship("User", backref="posts")
     tags = db.relationship("Tag", secondary="post_tag", backref="posts")
+    # Other language versions sharing this post's path; the
+    # ``uix_path_language`` constraint index serves the lookup.
+    translations = db.relationship(
+        "Post",
+        primaryjoin="and_(remote(Post.path) == foreign(Post.path), "
+        "remote(Post.id) != foreign(Post.id))",
+        viewonly=True,
+        uselist=True,
+        order_by="Post.language",
+    )
     latitude = db.Column(db.Float)
     longitude = db.Column(db.Float)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -71,15 +81,18 @@ class Post(db.Model):
         return self.title or _("[deleted]")
 
 
+# Search only filters on MATCH and never ranks with bm25(), so the
+# per-row token counts kept in post_fts_docsize are dropped (columnsize=0).
+POST_FTS_CREATE_SQL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS post_fts "
+    "USING fts5(body, content=\"post\", content_rowid=\"id\", columnsize=0)"
+)
+
+
 @event.listens_for(Post.__table__, "after_create")
 def create_post_fts(target, connection, **kw):
     """Create FTS5 table and triggers for Post.body."""
-    connection.execute(
-        text(
-            "CREATE VIRTUAL TABLE IF NOT EXISTS post_fts "
-            "USING fts5(body, content=\"post\", content_rowid=\"id\")"
-        )
-    )
+    connection.execute(text(POST_FTS_CREATE_SQL))
     connection.execute(
         text(
             "CREATE TRIGGER post_fts_ai AFTER INSERT ON post BEGIN "
@@ -107,6 +120,8 @@ def create_post_fts(target, connection, **kw):
 class Tag(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), unique=True, nullable=False)
+    # JSON-encoded list of lowercase synonyms computed when the tag is saved
+    synonyms = db.Column(db.Text)
 
 
 class PostTag(db.Model):
@@ -254,7 +269,21 @@ class UserPostCitation(db.Model):
     user = db.relationship("User")
 
 
+db.Index("ix_tag_name_lower", db.func.lower(Tag.name))
+# Tag-to-post lookups; the primary key only leads with post_id.
+db.Index("ix_post_tag_tag_post", PostTag.tag_id, PostTag.post_id)
+# Range scan for the bounding-box prefilter of location searches.
+db.Index("ix_post_latitude_longitude", Post.latitude, Post.longitude)
+# Profile pages list and count a user's posts; the implicit rowid suffix
+# also serves their ORDER BY id. Lookups by (path, language) use the
+# uix_path_language constraint index.
+db.Index("ix_post_author_id", Post.author_id)
 db.Index("ix_post_metadata_key_post", PostMetadata.key, PostMetadata.post_id)
+# Lets COUNT(DISTINCT ip_address) on the view stats page scan the index
+# instead of the table.
+db.Index("ix_post_view_ip_address", PostView.ip_address)
+# Range scan for the top-posts windows; post_id makes it covering.
+db.Index("ix_post_view_viewed_post", PostView.viewed_at, PostView.post_id)
 db.Index(
     "ix_user_post_metadata_key_post_user",
     UserPostMetadata.key,
@@ -265,6 +294,15 @@ db.Index("ix_post_citation_post_id", PostCitation.post_id)
 db.Index("ix_post_citation_user_id", PostCitation.user_id)
 db.Index("ix_user_post_citation_post_id", UserPostCitation.post_id)
 db.Index("ix_user_post_citation_user_id", UserPostCitation.user_id)
+# Serves the per-user citation list on post pages, already in display order.
+# UserPostMetadata and PostWatch lookups by (post_id, user_id) are covered by
+# the leading columns of their unique constraint and primary key.
+db.Index(
+    "ix_user_post_citation_post_user_created",
+    UserPostCitation.post_id,
+    UserPostCitation.user_id,
+    UserPostCitation.created_at,
+)
 db.Index(
     "uq_post_citation_doi",
     PostCitation.post_id,
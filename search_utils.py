@@ -21,6 +21,16 @@ SYNONYM_MAP: Dict[str, List[str]] = {
     "speedy": ["fast", "quick", "rapid"],
 }
 
+_TOKEN_RE = re.compile(r"\w+")
+
+# The tail of each ``OR`` group is fixed per key, so build it once; only the
+# leading token (kept in the user's casing) varies per query.
+_GROUP_TAILS: Dict[str, str] = {
+    key: "".join(f" OR {syn}" for syn in synonyms) + ")"
+    for key, synonyms in SYNONYM_MAP.items()
+    if synonyms
+}
+
 
 def expand_with_synonyms(query: str) -> str:
     """Expand a search query to include known synonyms.
@@ -30,13 +40,9 @@ def expand_with_synonyms(query: str) -> str:
     suitable for use with SQLite's FTS ``MATCH`` operator.
     """
 
-    tokens = re.findall(r"\w+", query)
+    tokens = _TOKEN_RE.findall(query)
     parts: List[str] = []
     for token in tokens:
-        synonyms = SYNONYM_MAP.get(token.lower())
-        if synonyms:
-            group = " OR ".join([token] + synonyms)
-            parts.append(f"({group})")
-        else:
-            parts.append(token)
+        tail = _GROUP_TAILS.get(token.lower())
+        parts.append("(" + token + tail if tail else token)
     return " ".join(parts) if parts else query
@@ -58,3 +58,21 @@ def normal_client():
 def test_non_admin_forbidden(normal_client):
     resp = normal_client.get('/admin/db-status')
     assert resp.status_code == 403
+
+
+def test_sqlite_connections_use_wal(client):
+    from sqlalchemy import text
+    with app.app_context():
+        with db.engine.connect() as conn:
+            assert conn.execute(text('PRAGMA journal_mode')).scalar() == 'wal'
+            assert conn.execute(text('PRAGMA synchronous')).scalar() == 1
+            assert conn.execute(text('PRAGMA temp_store')).scalar() == 2
+
+
+def test_other_engines_keep_default_pragmas(tmp_path):
+    from sqlalchemy import create_engine, text
+    engine = create_engine(f'sqlite:///{tmp_path / "other.db"}')
+    with engine.connect() as conn:
+        assert conn.execute(text('PRAGMA journal_mode')).scalar() == 'delete'
+        assert conn.execute(text('PRAGMA temp_store')).scalar() == 0
+    engine.dispose()
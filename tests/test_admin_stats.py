@@ -49,6 +49,9 @@ def test_admin_stats_time_series_json(client):
     assert 'daily' in data and 'weekly' in data and 'monthly' in data and 'yearly' in data
     daily_counts = {item['period']: item['count'] for item in data['daily']}
     assert len(daily_counts) >= 2
+    assert sum(item['count'] for item in data['weekly']) == 2
+    assert sum(item['count'] for item in data['yearly']) == 2
+    assert data['monthly'][-1]['period'] == datetime.utcnow().strftime('%Y-%m')
 
 
 @pytest.fixture
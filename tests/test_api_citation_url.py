@@ -49,3 +49,31 @@ def test_api_add_url_citation(client):
         cit = PostCitation.query.filter_by(post_id=post_id).first()
         assert cit.citation_text == 'https://example.com'
         assert cit.context == 'Intro'
+
+
+def test_api_rejects_duplicate_url_citation(client):
+    client.post(
+        '/post/new',
+        data={
+            'title': 'Title',
+            'body': 'Body',
+            'path': 'p',
+            'language': 'en',
+            'tags': '',
+            'metadata': '',
+            'user_metadata': '',
+        },
+    )
+    with app.app_context():
+        post_id = Post.query.first().id
+    url = f'/api/posts/{post_id}/citation'
+    assert client.post(url, json={'url': 'https://example.com'}).status_code == 201
+    resp = client.post(url, json={'url': 'https://example.com'})
+    assert resp.status_code == 400
+    with app.app_context():
+        from app import citation_exists
+
+        cid = PostCitation.query.first().id
+        assert citation_exists(post_id, text='https://example.com')
+        assert not citation_exists(post_id, text='https://example.com', exclude_id=cid)
+        assert not citation_exists(post_id, doi='10.1/x')
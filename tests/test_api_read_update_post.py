@@ -56,3 +56,15 @@ def test_api_update_post(client_and_post):
         assert meta['lon'] == '2.0'
         assert post.latitude == 1.0
         assert post.longitude == 2.0
+
+
+def test_api_update_post_replaces_metadata_and_keeps_views(client_and_post):
+    client, pid = client_and_post
+    with app.app_context():
+        db.session.add(PostMetadata(post_id=pid, key='views', value=5))
+        db.session.commit()
+    resp = client.put(f'/api/posts/{pid}', json={'metadata': {'views': 100, 'new': 'x'}})
+    assert resp.status_code == 200
+    with app.app_context():
+        meta = {m.key: m.value for m in db.session.get(Post, pid).metadata}
+        assert meta == {'views': 5, 'new': 'x'}
@@ -50,6 +50,24 @@ def test_api_search_pagination(client):
     assert len(data['posts']) == 3
 
 
+def test_api_list_without_query_defaults_to_twenty(client):
+    with app.app_context():
+        user = User.query.first()
+        db.session.add_all([
+            Post(title=f'Extra {i}', body='x', path=f'e{i}', language='en', author_id=user.id)
+            for i in range(25)
+        ])
+        db.session.commit()
+
+    data = client.get('/api/posts').get_json()
+    assert data['total'] == 28
+    assert len(data['posts']) == 20
+    assert data['posts'][0] == {'id': 28, 'path': 'e24', 'language': 'en', 'title': 'Extra 24'}
+
+    data = client.get('/api/posts', query_string={'limit': 0}).get_json()
+    assert len(data['posts']) == 28
+
+
 def test_api_search_synonyms(client):
     with app.app_context():
         user = User.query.first()
@@ -62,3 +80,28 @@ def test_api_search_synonyms(client):
     data = resp.get_json()
     titles = [p['title'] for p in data['posts']]
     assert 'Quick Post' in titles
+
+
+def test_orjson_provider_matches_default_encoding():
+    pytest.importorskip('orjson')
+    from datetime import datetime
+    from decimal import Decimal
+    from flask.json.provider import DefaultJSONProvider
+    from app import ORJSONProvider
+
+    data = {'b': [1, 2.5, None], 'a': 'x', 'when': datetime(2024, 1, 2, 3, 4, 5), 'd': Decimal('1.5')}
+    default = DefaultJSONProvider(app)
+    fast = ORJSONProvider(app)
+    assert fast.loads(fast.dumps(data)) == default.loads(default.dumps(data))
+    assert fast.dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+
+
+def test_orjson_provider_handles_big_ints_and_nan():
+    pytest.importorskip('orjson')
+    from app import ORJSONProvider, to_json
+
+    fast = ORJSONProvider(app)
+    assert fast.loads(fast.dumps({'n': 2 ** 70})) == {'n': 2 ** 70}
+    assert fast.dumps({'x': float('nan'), 'y': float('inf')}) == '{"x":null,"y":null}'
+    assert to_json([2 ** 70]) == '[1180591620717411303424]'
+    assert to_json([float('nan')]) == '[null]'
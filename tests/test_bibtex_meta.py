@@ -50,3 +50,29 @@ def test_bibtex_meta_tags_present(client):
     assert '<meta name="citation_author" content="author">' in html
     assert 'citation_bibtex' in html
 
+
+
+def test_meta_description_collapses_markup():
+    from app import meta_description
+
+    html = '<p>First   <strong>bold</strong>\n line</p>' + '<p>' + 'x' * 200 + '</p>'
+    description = meta_description(html)
+    assert description.startswith('First bold linexxx')
+    assert len(description) == 160
+
+
+def test_post_bibtex_key_strips_non_word_characters():
+    from app import post_bibtex
+
+    entry = post_bibtex(7, 'Title', 'jane.doe', 2024, 'http://x/en/t')
+    assert entry.startswith('@misc{janedoe20247, title={ Title }')
+    assert 'url={ http://x/en/t }' in entry
+
+
+def test_meta_description_unescapes_entities_and_stops_early():
+    from app import meta_description
+
+    html = '<p>Fish &amp; chips</p>' + '<p>word </p>' * 10000
+    description = meta_description(html)
+    assert description.startswith('Fish & chipsword word')
+    assert len(description) == 160
@@ -41,3 +41,30 @@ def test_suggest_citations_internal(app_ctx):
         assert 'Quantum mechanics' in cand
         assert '/en/quantum' in cand
 
+
+def test_fetch_bibtex_by_title_memoizes_successes(monkeypatch):
+    calls = []
+    results = iter([None, '@article{a}'])
+
+    def fake_remote(title):
+        calls.append(title)
+        return next(results)
+
+    monkeypatch.setattr(app, '_fetch_bibtex_remote', fake_remote)
+    app._bibtex_lookup_memo.clear()
+    assert app.fetch_bibtex_by_title('Plate tectonics') is None
+    assert app.fetch_bibtex_by_title('Plate tectonics') == '@article{a}'
+    assert app.fetch_bibtex_by_title('Plate tectonics') == '@article{a}'
+    assert calls == ['Plate tectonics', 'Plate tectonics']
+    app._bibtex_lookup_memo.clear()
+
+
+def test_http_session_refuses_cookies():
+    import requests
+    from requests.cookies import MockRequest, create_cookie
+
+    req = MockRequest(requests.Request('GET', 'https://api.crossref.org/works').prepare())
+    app.http_session.cookies.set_cookie_if_ok(
+        create_cookie('session', '1', domain='api.crossref.org'), req
+    )
+    assert len(app.http_session.cookies) == 0
@@ -41,3 +41,21 @@ def test_duplicate_tags_are_deduplicated(client):
         assert sorted(t.name for t in post.tags) == ['dupe', 'other']
         assert len(post.tags) == 2
 
+
+def test_missing_tags_are_created_in_order(client, monkeypatch):
+    import app as app_module
+    from app import Tag, get_or_create_tags
+
+    monkeypatch.setattr(
+        app_module, 'wordnet_synonyms', lambda name: frozenset({name, f'{name}s'})
+    )
+    with app.app_context():
+        db.session.add(Tag(name='old'))
+        db.session.commit()
+        tags = get_or_create_tags(['new', 'old', 'other', 'new'])
+        db.session.commit()
+        assert [t.name for t in tags] == ['new', 'old', 'other']
+        assert all(t.id is not None for t in tags)
+        assert Tag.query.count() == 3
+        assert Tag.query.filter_by(name='other').one().synonyms == '["other", "others"]'
+        assert app_module.get_tag_synonyms('new') == {'new', 'news'}
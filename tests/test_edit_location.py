@@ -34,3 +34,18 @@ def test_edit_updates_location(client):
         post = Post.query.get(pid)
         assert post.latitude == 5.0
         assert post.longitude == 6.0
+
+
+def test_edit_replaces_metadata_and_keeps_views(client):
+    client.post('/post/new', data={'title':'t','body':'b','path':'p','language':'en','tags':'','metadata':'{"a":1,"b":2}','user_metadata':''})
+    with app.app_context():
+        pid = Post.query.first().id
+    client.get('/docs/en/p')
+    with app.app_context():
+        kept_id = PostMetadata.query.filter_by(post_id=pid, key='a').first().id
+    client.post(f'/post/{pid}/edit', data={'title':'t','body':'b','path':'p','language':'en','tags':'','metadata':'{"a":3,"c":4,"views":99}','user_metadata':''})
+    with app.app_context():
+        rows = {m.key: m for m in PostMetadata.query.filter_by(post_id=pid)}
+        assert {k: m.value for k, m in rows.items() if k != 'views'} == {'a': 3, 'c': 4}
+        assert rows['a'].id == kept_id
+        assert int(rows['views'].value) == 1
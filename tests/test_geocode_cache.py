@@ -83,3 +83,76 @@ def test_geocode_address_cache_bytes(monkeypatch):
     result = app.geocode_address('byte addr')
     assert result == (3.0, 4.0)
     assert calls['count'] == 0
+
+
+def test_reverse_geocode_memoized_and_batched(monkeypatch):
+    monkeypatch.setattr(app, 'geocode_cache', None)
+    monkeypatch.setattr(app, '_reverse_geocode_memo', app.OrderedDict())
+
+    calls = {'count': 0}
+
+    class DummyLocation:
+        def __init__(self, lat, lon):
+            self.address = f'{lat},{lon}'
+
+    def fake_reverse(coords):
+        calls['count'] += 1
+        return DummyLocation(*coords)
+
+    monkeypatch.setattr(app.geolocator, 'reverse', fake_reverse)
+
+    coords = [(1.0, 2.0), (3.0, 4.0)]
+    results = [f.result() for f in app.submit_reverse_geocodes(coords)]
+    assert results == ['1.0,2.0', '3.0,4.0']
+    assert calls['count'] == 2
+    assert app.reverse_geocode_coords(3.0, 4.0) == '3.0,4.0'
+    results = [f.result() for f in app.submit_reverse_geocodes(coords + [(1.0, 2.0)])]
+    assert results == ['1.0,2.0', '3.0,4.0', '1.0,2.0']
+    assert calls['count'] == 2
+
+
+def test_reverse_geocode_shares_nearby_cells(monkeypatch):
+    monkeypatch.setattr(app, 'geocode_cache', None)
+    monkeypatch.setattr(app, '_reverse_geocode_memo', app.OrderedDict())
+    seen = []
+
+    class DummyLocation:
+        address = 'Somewhere'
+
+    def fake_reverse(coords):
+        seen.append(coords)
+        return DummyLocation()
+
+    monkeypatch.setattr(app.geolocator, 'reverse', fake_reverse)
+
+    assert app.reverse_geocode_coords(37.566512, 126.977981) == 'Somewhere'
+    assert app.reverse_geocode_coords(37.566498, 126.978012) == 'Somewhere'
+    assert seen == [(37.5665, 126.978)]
+
+
+def test_nominatim_requests_are_spaced(monkeypatch):
+    monkeypatch.setattr(app, 'geocode_cache', None)
+    monkeypatch.setattr(app, '_reverse_geocode_memo', app.OrderedDict())
+    limiter = app._nominatim_rate_limit
+    monkeypatch.setattr(limiter, '_last_call', None)
+    clock = {'now': 100.0}
+    waits = []
+
+    def fake_sleep(seconds):
+        waits.append(seconds)
+        clock['now'] += seconds
+
+    monkeypatch.setattr(limiter, '_clock', lambda: clock['now'])
+    monkeypatch.setattr(limiter, '_sleep', fake_sleep)
+
+    class DummyLocation:
+        address = 'Somewhere'
+        latitude = 1.0
+        longitude = 2.0
+
+    monkeypatch.setattr(app.geolocator, 'reverse', lambda coords: DummyLocation())
+    monkeypatch.setattr(app.geolocator, 'geocode', lambda address: DummyLocation())
+
+    assert app.reverse_geocode_coords(5.0, 6.0) == 'Somewhere'
+    assert app.geocode_address('spaced addr') == (1.0, 2.0)
+    assert waits == [app.NOMINATIM_MIN_DELAY]
@@ -0,0 +1,36 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import keyword_highlight_plugin as plugin
+
+
+def test_keywords_are_cached_per_paragraph():
+    plugin._keyword.cache_clear()
+    html = '<p>The volcano erupted. Lava from the volcano flowed.</p>'
+    first = plugin.apply_keyword_highlight_plugin(html, 'en')
+    assert first.startswith('<p>[erupted] <u><strong>The volcano erupted.</strong></u>')
+    # The same paragraph inside another page reuses the extracted keyword.
+    again = plugin.apply_keyword_highlight_plugin(html + '<p></p>', 'en')
+    assert again == first + '<p></p>'
+    info = plugin._keyword.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_extractor_is_built_once_per_language():
+    assert plugin._extractor('en') is plugin._extractor('en')
+    assert plugin._extractor('es') is not plugin._extractor('en')
+
+
+def test_insert_tags_places_markers_around_inline_tags():
+    html = 'One <em>two</em>. <a href="x">Three</a> four.'
+    # Plain text: 'One two. Three four.'
+    assert plugin._insert_tags(html, [(0, 8)]) == (
+        '<u><strong>One <em>two</em>.</strong></u> <a href="x">Three</a> four.'
+    )
+    assert plugin._insert_tags(html, [(8, 20)]) == (
+        'One <em>two</em>.<u><strong> <a href="x">Three</a> four.</strong></u>'
+    )
+    assert plugin._insert_tags(html, [(9, 14)]) == (
+        'One <em>two</em>. <a href="x"><u><strong>Three</strong></u></a> four.'
+    )
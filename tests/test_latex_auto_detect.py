@@ -44,3 +44,9 @@ def test_caret_only_not_converted():
         html, _ = render_markdown(r"Power (x^2) test", enable_mathjax=True)
     assert "(x^2)" in html
     assert "$$x^2$$" not in html
+
+
+def test_non_wrapping_inner_parentheses_kept():
+    with app.app_context():
+        html, _ = render_markdown(r"Sum (((x_1)) + (y_2)) test", enable_mathjax=True)
+    assert "\\(((x_1)) + (y_2)\\)" in html
@@ -0,0 +1,159 @@
+import os
+import sys
+
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import app as app_module
+from app import app, db, render_markdown, Tag, Post, User
+
+
+def test_render_markdown_is_memoized(app_ctx, monkeypatch):
+    calls = {'count': 0}
+    original = app_module._render_markdown_uncached
+
+    def counting(*args, **kwargs):
+        calls['count'] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(app_module, '_render_markdown_uncached', counting)
+    first = render_markdown('memo **cache** test', '/en/')
+    second = render_markdown('memo **cache** test', '/en/')
+    assert first == second
+    assert calls['count'] == 1
+    render_markdown('memo **cache** test', '/es/')
+    assert calls['count'] == 2
+
+
+def test_render_markdown_cache_invalidated_by_tags(app_ctx, monkeypatch):
+    monkeypatch.setattr(app_module, 'get_tag_synonyms', lambda name: {name.lower()})
+    html, _ = render_markdown('Caching geology notes')
+    assert 'tag-link' not in html
+    user = User(username='u', role='editor')
+    user.set_password('pw')
+    tag = Tag(name='geology')
+    post = Post(title='T', body='Rocks', path='t', language='en', author=user)
+    post.tags.append(tag)
+    db.session.add_all([user, tag, post])
+    db.session.commit()
+    html, _ = render_markdown('Caching geology notes')
+    assert 'href="/tag/geology"' in html
+
+
+def test_render_cache_expires_for_changes_from_other_workers(app_ctx, monkeypatch):
+    calls = {'count': 0}
+    original = app_module._render_markdown_uncached
+
+    def counting(*args, **kwargs):
+        calls['count'] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(app_module, '_render_markdown_uncached', counting)
+    render_markdown('ttl cache test')
+    render_markdown('ttl cache test')
+    assert calls['count'] == 1
+    # A tag inserted by another process does not bump this process's version.
+    db.session.execute(text("INSERT INTO tag (name, synonyms) VALUES ('ttl', '[\"ttl\"]')"))
+    db.session.commit()
+    monkeypatch.setattr(app_module, 'TAG_MAP_TTL', -1)
+    render_markdown('ttl cache test')
+    assert calls['count'] == 2
+    assert app_module._candidate_tag_names('ttl cache test') == {'ttl'}
+
+
+def test_candidate_tags_require_matching_words(app_ctx, monkeypatch):
+    monkeypatch.setattr(
+        app_module, 'wordnet_synonyms', lambda name: frozenset({name.lower(), 'plate tectonics'})
+    )
+    db.session.add(Tag(name='Geology'))
+    db.session.commit()
+
+    def no_requery(name):
+        raise AssertionError('synonyms should come from the loaded Tag rows')
+
+    monkeypatch.setattr(app_module, 'get_tag_synonyms', no_requery)
+    assert app_module._candidate_tag_names('Nothing relevant here') == set()
+    assert app_module._candidate_tag_names('Plate boundaries and tectonics') == {'Geology'}
+    assert app_module._candidate_tag_names('GEOLOGY notes') == {'Geology'}
+
+
+def test_keyword_highlight_is_memoized(monkeypatch):
+    calls = {'count': 0}
+
+    def fake_highlight(html, language):
+        calls['count'] += 1
+        return f'{language}:{html}'
+
+    monkeypatch.setattr(app_module, 'apply_keyword_highlight_plugin', fake_highlight)
+    app_module.highlight_keywords.cache_clear()
+    assert app_module.highlight_keywords('<p>x</p>', 'en') == 'en:<p>x</p>'
+    assert app_module.highlight_keywords('<p>x</p>', 'en') == 'en:<p>x</p>'
+    assert calls['count'] == 1
+    app_module.highlight_keywords('<p>x</p>', 'es')
+    assert calls['count'] == 2
+    app_module.highlight_keywords.cache_clear()
+
+
+def test_document_base_url_is_built_once_per_request(monkeypatch):
+    calls = []
+    original = app_module.url_for
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(app_module, 'url_for', counting)
+    with app.test_request_context('/'):
+        assert app_module.document_base_url('en') == '/en/'
+        assert app_module.document_base_url('en') == '/en/'
+        assert app_module.document_base_url('es') == '/es/'
+    assert len(calls) == 2
+
+
+def test_untagged_post_edits_keep_cached_renders(app_ctx, monkeypatch):
+    calls = {'count': 0}
+    original = app_module._render_markdown_uncached
+
+    def counting(*args, **kwargs):
+        calls['count'] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(app_module, '_render_markdown_uncached', counting)
+    user = User(username='u', role='editor')
+    user.set_password('pw')
+    plain = Post(title='Plain', body='one', path='plain', language='en', author=user)
+    tagged = Post(title='Tagged', body='two', path='tagged', language='en', author=user)
+    tagged.tags.append(Tag(name='geology'))
+    db.session.add_all([user, plain, tagged])
+    db.session.commit()
+
+    render_markdown('untagged edit cache test')
+    db.session.add(Post(title='New', body='three', path='new', language='en', author=user))
+    plain.body = 'one, edited'
+    db.session.commit()
+    render_markdown('untagged edit cache test')
+    assert calls['count'] == 1
+
+    tagged.body = 'two, edited'
+    db.session.commit()
+    render_markdown('untagged edit cache test')
+    assert calls['count'] == 2
+
+
+def test_markdown_instances_are_reused_per_options(app_ctx, monkeypatch):
+    monkeypatch.setattr(app_module, 'get_tag_synonyms', lambda name: {name.lower()})
+    first = app_module._markdown_instance('/en/', True, False)
+    assert app_module._markdown_instance('/en/', True, False) is first
+    assert app_module._markdown_instance('/es/', True, False) is not first
+    user = User(username='u', role='editor')
+    user.set_password('pw')
+    post = Post(title='T', body='Rocks', path='t', language='en', author=user)
+    post.tags.append(Tag(name='geology'))
+    db.session.add_all([user, post])
+    db.session.commit()
+    html, toc = app_module._render_markdown_uncached('# Geology\n\n[[x]]', '/en/', True, False)[:2]
+    assert 'tag-link' in html and 'href="/en/x"' in html and 'Geology' in toc
+    # The tag pattern from the previous text does not leak into the next.
+    html, toc = app_module._render_markdown_uncached('# Plain\n\nText', '/en/', True, False)[:2]
+    assert 'tag-link' not in html and 'Plain' in toc
+    assert 'taglink' not in first.inlinePatterns
@@ -107,15 +107,6 @@ def test_markdown_preview_renders_html(client):
     assert resp.get_json()['html'] == '<p>[bold] <b><u><strong>bold</strong></u></b></p>'
 
 
-@pytest.fixture
-def app_ctx():
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-    with app.app_context():
-        db.create_all()
-        yield
-        db.drop_all()
-
-
 def test_render_markdown_auto_links_tag(app_ctx):
     with app.app_context():
         user = User(username='u', role='editor')
@@ -80,6 +80,9 @@ def test_citation_notifications(client):
         assert Notification.query.filter_by(user_id=author.id).count() == 1
         assert Notification.query.filter_by(user_id=watcher2.id).count() == 1
         assert Notification.query.filter_by(user_id=watcher1.id).count() == 0
+        note = Notification.query.filter_by(user_id=watcher2.id).one()
+        assert note.created_at is not None
+        assert note.link == f'/post/{post_id}'
 
 
 def test_metadata_update_notifies_author(client):
@@ -126,3 +129,18 @@ def test_notification_link_rendered(client):
     assert f'href="/post/{post_id}"' in resp.text
     logout(client)
 
+
+
+def test_watch_and_unwatch_are_idempotent(client):
+    from app import PostWatch
+
+    post_id = create_post(client)
+    login(client, 'watcher1')
+    assert client.post(f'/post/{post_id}/watch').status_code == 302
+    assert client.post(f'/post/{post_id}/watch').status_code == 302
+    with app.app_context():
+        assert PostWatch.query.filter_by(post_id=post_id).count() == 1
+    client.post(f'/post/{post_id}/unwatch')
+    assert client.post(f'/post/{post_id}/unwatch').status_code == 302
+    with app.app_context():
+        assert PostWatch.query.filter_by(post_id=post_id).count() == 0
@@ -77,3 +77,36 @@ def test_posts_category_filter(client):
     with app.app_context():
         assert ('news', 'noticias') in get_category_tags('es')
 
+
+def test_category_parse_is_memoized_per_setting_value():
+    import app as app_module
+    app_module._parse_category_tags.cache_clear()
+    raw = '{"news": {"en": "news", "es": "noticias"}}'
+    assert app_module._parse_category_tags(raw, 'es') == (('news', 'noticias'),)
+    app_module._parse_category_tags(raw, 'es')
+    assert app_module._parse_category_tags.cache_info().hits == 1
+    assert app_module._parse_category_tags('news, tech', 'es') == (
+        ('news', 'news'),
+        ('tech', 'tech'),
+    )
+
+
+def test_settings_store_compact_category_json(client):
+    with app.app_context():
+        admin = User(username='admin', role='admin')
+        admin.set_password('pw')
+        db.session.add(admin)
+        db.session.commit()
+    client.post('/login', data={'username': 'admin', 'password': 'pw'})
+    client.post(
+        '/settings',
+        data={'post_categories': '{\n  "news": {"en": "news", "es": "noticias"}\n}'},
+    )
+    with app.app_context():
+        assert Setting.query.filter_by(key='post_categories').one().value == (
+            '{"news":{"en":"news","es":"noticias"}}'
+        )
+    resp = client.post('/settings', data={'post_categories': 'news, tech'})
+    assert resp.status_code == 302
+    with app.app_context():
+        assert Setting.query.filter_by(key='post_categories').one().value.startswith('{"news"')
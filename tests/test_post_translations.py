@@ -0,0 +1,22 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import app, db, User, Post
+
+
+def test_document_lists_translations(app_ctx):
+    user = User(username='u', role='editor')
+    user.set_password('pw')
+    db.session.add_all([
+        user,
+        Post(title='Post', body='body', path='p', language='en', author=user),
+        Post(title='Entrada', body='cuerpo', path='p', language='es', author=user),
+        Post(title='Other', body='body', path='q', language='de', author=user),
+    ])
+    db.session.commit()
+    resp = app.test_client().get('/docs/en/p')
+    html = resp.get_data(as_text=True)
+    assert 'href="/es/p">es</a>' in html
+    assert 'href="/de/q"' not in html
+    assert 'href="/en/p">en</a>' not in html
@@ -59,5 +59,5 @@ def test_profile_includes_post_locations(client):
     resp = client.get('/user/u')
     data = resp.get_data(as_text=True)
     assert 'postLocations' in data
-    assert '"lat": 10.0' in data
-    assert '"lat": 30.0' in data
+    assert '"lat":10.0' in data
+    assert '"lat":30.0' in data
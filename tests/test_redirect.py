@@ -54,3 +54,16 @@ def test_redirect_on_path_change(client):
     resp = client.get('/docs/en/old')
     assert resp.status_code == 302
     assert resp.headers['Location'].endswith('/en/new')
+
+
+def test_existing_post_takes_precedence_over_redirect(client):
+    with app.app_context():
+        user = User.query.filter_by(username='editor').first()
+        post = Post(title='Title', body='Body', path='reused', language='en', author=user)
+        db.session.add_all(
+            [post, Redirect(old_path='reused', new_path='elsewhere', language='en')]
+        )
+        db.session.commit()
+
+    resp = client.get('/docs/en/reused')
+    assert resp.status_code == 200
@@ -79,3 +79,26 @@ def test_latlon_fields_reverse_geocode(client, monkeypatch):
     assert b'Test Place' in resp.data
     resp = client.get('/en/p2')
     assert b'Test Place' in resp.data
+
+
+def test_string_geojson_coordinates_render(client, monkeypatch):
+    monkeypatch.setattr(app_module, '_reverse_geocode_remote', lambda lat, lon: 'String Place')
+    app_module._reverse_geocode_memo.clear()
+    resp = client.post(
+        '/post/new',
+        data={
+            'title': 'Title',
+            'body': 'Body',
+            'path': 'p3',
+            'language': 'en',
+            'tags': '',
+            'metadata': '{"loc":{"type":"Point","coordinates":["2","1"]},'
+                        '"bad":{"type":"Point","coordinates":["x","y"]}}',
+            'user_metadata': '',
+        },
+    )
+    assert resp.status_code == 302
+    resp = client.get('/en/p3')
+    assert resp.status_code == 200
+    assert b'String Place' in resp.data
+    app_module._reverse_geocode_memo.clear()
@@ -51,3 +51,25 @@ def test_revert_revision(client):
         revisions = Revision.query.filter_by(post_id=post_id).order_by(Revision.id).all()
         assert len(revisions) == 2
         assert revisions[-1].title == 'Edited Title'
+
+
+def test_revision_diff_text_short_circuits_and_memoizes(monkeypatch):
+    from types import SimpleNamespace
+    import app as app_module
+
+    revision = SimpleNamespace(id=1, body='a\nb')
+    assert app_module.revision_diff_text(revision, 'a\nb') == ''
+    calls = {'count': 0}
+    original = app_module.difflib.unified_diff
+
+    def counting(*args, **kwargs):
+        calls['count'] += 1
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(app_module.difflib, 'unified_diff', counting)
+    app_module._revision_diff_memo.clear()
+    first = app_module.revision_diff_text(revision, 'a\nc')
+    assert '-b' in first and '+c' in first
+    assert app_module.revision_diff_text(revision, 'a\nc') == first
+    assert calls['count'] == 1
+    app_module._revision_diff_memo.clear()
@@ -5,7 +5,7 @@ import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from app import app, db, User, Post, Tag
-from sqlalchemy import text
+from sqlalchemy import select, text
 
 
 @pytest.fixture
@@ -54,3 +54,83 @@ def test_fulltext_synonym_search(client):
     resp = client.get('/search', query_string={'q': 'fast'})
     text = resp.get_data(as_text=True)
     assert 'Speed' in text
+
+
+def test_fts_subquery_reuses_statement(client):
+    from app import fts_post_ids
+    with app.app_context():
+        first = fts_post_ids('apple')
+        second = fts_post_ids('carrot')
+        assert first._generate_cache_key() == second._generate_cache_key()
+        ids = db.session.scalars(select(Post.id).where(Post.id.in_(second))).all()
+        assert [db.session.get(Post, i).title for i in ids] == ['Banana']
+
+
+def test_tag_filter_uses_tag_name_index(client):
+    from app import tagged_post_ids
+    with app.app_context():
+        stmt = select(Post.id).where(Post.id.in_(tagged_post_ids({'news'})))
+        sql = str(stmt.compile(db.engine, compile_kwargs={'literal_binds': True}))
+        plan = ' '.join(
+            row[3] for row in db.session.execute(text('EXPLAIN QUERY PLAN ' + sql))
+        )
+        assert 'ix_tag_name_lower' in plan
+        assert 'ix_post_tag_tag_post' in plan
+        assert db.session.scalars(stmt).all() == [
+            db.session.scalar(select(Post.id).filter_by(title='Apple'))
+        ]
+
+
+def test_fts_subquery_keeps_fts_index_with_filters(client):
+    from app import fts_post_ids
+    with app.app_context():
+        stmt = select(Post.id).where(
+            Post.id.in_(fts_post_ids('apple')), Post.language == 'en'
+        )
+        compiled = stmt.compile(db.engine)
+        sql = str(compiled)
+        params = tuple(compiled.params[k] for k in compiled.positiontup)
+        raw = db.session.connection().connection.driver_connection
+        plan = ' '.join(row[3] for row in raw.execute('EXPLAIN QUERY PLAN ' + sql, params))
+        assert 'VIRTUAL TABLE INDEX 0:M' in plan
+        assert [db.session.get(Post, i).title for i in db.session.scalars(stmt)] == ['Apple']
+
+
+def test_post_fts_migrates_to_columnsize_zero(client):
+    from app import fts_post_ids
+    from sqlalchemy import inspect
+    with app.app_context():
+        assert not inspect(db.engine).has_table('post_fts_docsize')
+        with db.engine.begin() as conn:
+            conn.execute(text('DROP TABLE post_fts'))
+            conn.execute(text(
+                'CREATE VIRTUAL TABLE post_fts '
+                'USING fts5(body, content="post", content_rowid="id")'
+            ))
+            conn.execute(text("INSERT INTO post_fts(post_fts) VALUES('rebuild')"))
+        assert inspect(db.engine).has_table('post_fts_docsize')
+
+        result = app.test_cli_runner().invoke(args=['migrate-post-fts'])
+        assert 'Rebuilt post_fts.' in result.output
+
+        assert not inspect(db.engine).has_table('post_fts_docsize')
+        result = app.test_cli_runner().invoke(args=['migrate-post-fts'])
+        assert 'post_fts is up to date.' in result.output
+        ids = db.session.scalars(select(Post.id).where(Post.id.in_(fts_post_ids('carrot')))).all()
+        assert [db.session.get(Post, i).title for i in ids] == ['Banana']
+
+
+def test_model_indexes_added_to_existing_database(client):
+    from app import ensure_model_indexes
+    names = "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'ix_%'"
+    with app.app_context():
+        expected = set(db.session.scalars(text(names)))
+        assert {'ix_tag_name_lower', 'ix_post_view_viewed_post'} <= expected
+        with db.engine.begin() as conn:
+            conn.execute(text('DROP INDEX ix_tag_name_lower'))
+            conn.execute(text('DROP INDEX ix_post_view_viewed_post'))
+
+        ensure_model_indexes()
+        ensure_model_indexes()
+
+        assert set(db.session.scalars(text(names))) == expected
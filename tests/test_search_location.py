@@ -50,6 +50,44 @@ def test_search_filters_by_distance(client):
     assert 'Near Post' in data
     assert 'Far Post' not in data
     assert 'postCoords' in data
-    assert '"lat": 10.0' in data
-    assert '"lat": 20.0' not in data
+    assert '"lat":10.0' in data
+    assert '"lat":20.0' not in data
 
+
+def test_great_circle_km_known_distance():
+    from app import great_circle_km
+
+    assert great_circle_km(48.85, 2.35, 51.5, -0.13) == pytest.approx(343.5, abs=1)
+    assert great_circle_km(10.0, 10.0, 10.0, 10.0) == 0
+
+
+def test_search_location_paginates_matches(client):
+    with app.app_context():
+        user = User.query.first()
+        for i in range(3):
+            db.session.add(
+                Post(title=f'Near {i}', body='b', path=f'near{i}', language='en',
+                     author=user, latitude=10.0 + i / 100, longitude=10.0)
+            )
+        db.session.add(Post(title='Nowhere', body='b', path='nowhere', language='en', author=user))
+        db.session.commit()
+    app.config['SEARCH_RESULTS_PER_PAGE'] = 2
+    try:
+        resp = client.get('/search', query_string={'lat': 10, 'lon': 10, 'radius': 50, 'page': 2})
+    finally:
+        app.config.pop('SEARCH_RESULTS_PER_PAGE', None)
+    data = resp.get_data(as_text=True)
+    assert 'Near 1' in data and 'Near 2' in data
+    assert 'Near 0' not in data and 'Near Post' not in data
+    assert 'Nowhere' not in data
+
+
+def test_bounding_box_encloses_radius():
+    from app import bounding_box, great_circle_km
+
+    min_lat, max_lat, min_lon, max_lon = bounding_box(60.0, 10.0, 100)
+    assert great_circle_km(60.0, 10.0, max_lat, 10.0) == pytest.approx(100)
+    assert min_lon < 10.0 - 100 / 111.2 < max_lon
+    # Circles reaching a pole or the antimeridian keep no longitude bounds.
+    assert bounding_box(89.5, 0.0, 100)[2:] == (None, None)
+    assert bounding_box(0.0, 179.9, 100)[2:] == (None, None)
@@ -45,3 +45,18 @@ def test_search_pagination(client):
     text = resp.get_data(as_text=True)
     assert 'Apple 0' in text
     assert 'Apple 2' not in text
+
+
+def test_list_pagination_matches_query_pagination():
+    from flask_sqlalchemy.pagination import Pagination
+    from app import _ListPagination
+
+    pag = _ListPagination(['a'], page=5, per_page=2, total=19)
+    assert (pag.pages, pag.has_prev, pag.has_next) == (10, True, True)
+    assert list(pag.iter_pages(left_edge=2, right_edge=2, left_current=2, right_current=2)) == [
+        1, 2, 3, 4, 5, 6, 7, None, 9, 10,
+    ]
+    assert list(pag.iter_pages()) == list(Pagination.iter_pages(pag))
+    last = _ListPagination([], page=10, per_page=2, total=20)
+    assert not last.has_next
+    assert _ListPagination([], page=1, per_page=2, total=0).pages == 0
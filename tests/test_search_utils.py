@@ -0,0 +1,14 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from search_utils import expand_with_synonyms
+
+
+def test_expand_with_synonyms_keeps_token_casing():
+    assert expand_with_synonyms('Fast cars') == '(Fast OR quick OR rapid OR speedy) cars'
+
+
+def test_expand_with_synonyms_without_tokens_returns_query():
+    assert expand_with_synonyms('') == ''
+    assert expand_with_synonyms('?!') == '?!'
@@ -0,0 +1,39 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import app as app_module
+from app import db, Setting, get_setting
+
+
+def test_get_setting_reads_snapshot_once(app_ctx):
+    db.session.add_all([Setting(key='a', value='1'), Setting(key='b', value='2')])
+    db.session.commit()
+    assert get_setting('a') == '1'
+    assert app_module._settings_cache == {'a': '1', 'b': '2'}
+    assert get_setting('b') == '2'
+    assert get_setting('missing', 'fallback') == 'fallback'
+
+
+def test_get_setting_invalidated_on_write(app_ctx):
+    db.session.add(Setting(key='site_title', value='Old'))
+    db.session.commit()
+    assert get_setting('site_title') == 'Old'
+    Setting.query.filter_by(key='site_title').first().value = 'New'
+    db.session.commit()
+    assert get_setting('site_title') == 'New'
+    db.session.delete(Setting.query.filter_by(key='site_title').first())
+    db.session.commit()
+    assert get_setting('site_title', 'Default') == 'Default'
+
+
+def test_get_setting_snapshot_expires(app_ctx, monkeypatch):
+    db.session.add(Setting(key='site_title', value='Old'))
+    db.session.commit()
+    assert get_setting('site_title') == 'Old'
+    # Simulate a write from another process that bypasses this session.
+    with db.engine.begin() as conn:
+        conn.execute(db.text("UPDATE setting SET value = 'New' WHERE key = 'site_title'"))
+    assert get_setting('site_title') == 'Old'
+    monkeypatch.setattr(app_module, 'SETTINGS_CACHE_TTL', -1)
+    assert get_setting('site_title') == 'New'
@@ -61,3 +61,19 @@ def test_sitemap_skips_deleted_posts(client):
     assert resp.status_code == 200
     assert b'http://localhost/en/hello' in resp.data
     assert b'http://localhost/en/bye' not in resp.data
+
+
+def test_sitemap_is_well_formed_with_lastmod(client):
+    from xml.etree.ElementTree import fromstring
+
+    _create_post()
+    _create_post(title='Second', body='Body', path='second')
+    resp = client.get('/sitemap.xml')
+    root = fromstring(resp.data)
+    ns = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+    urls = root.findall(f'{ns}url')
+    assert [u.find(f'{ns}loc').text for u in urls] == [
+        'http://localhost/en/second',
+        'http://localhost/en/hello',
+    ]
+    assert all(u.find(f'{ns}lastmod') is not None for u in urls)
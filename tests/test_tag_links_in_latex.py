@@ -21,11 +21,25 @@ def test_tag_links_skipped_inside_latex(monkeypatch):
     )
 
     class DummyQuery:
+        def options(self, *args):
+            return self
+
+        filter = order_by = options
+
         def all(self):
-            return [SimpleNamespace(name='foo', posts=[post])]
+            return [SimpleNamespace(name='foo', synonyms='["foo"]', posts=[post])]
 
-    monkeypatch.setattr(app_module, 'Tag', SimpleNamespace(query=DummyQuery()))
-    monkeypatch.setattr(app_module, 'get_tag_synonyms', lambda name: {name})
+    monkeypatch.setattr(
+        app_module,
+        'Tag',
+        SimpleNamespace(
+            query=DummyQuery(),
+            id=app_module.Tag.id,
+            name=app_module.Tag.name,
+            posts=app_module.Tag.posts,
+        ),
+    )
+    monkeypatch.setattr(app_module, '_tag_vocabulary', None)
 
     with app.app_context():
         html, _ = render_markdown('$$foo$$ and foo', enable_mathjax=True)
@@ -48,11 +62,25 @@ def test_tag_links_skipped_inside_detected_latex(monkeypatch):
     )
 
     class DummyQuery:
+        def options(self, *args):
+            return self
+
+        filter = order_by = options
+
         def all(self):
-            return [SimpleNamespace(name='foo', posts=[post])]
+            return [SimpleNamespace(name='foo', synonyms='["foo"]', posts=[post])]
 
-    monkeypatch.setattr(app_module, 'Tag', SimpleNamespace(query=DummyQuery()))
-    monkeypatch.setattr(app_module, 'get_tag_synonyms', lambda name: {name})
+    monkeypatch.setattr(
+        app_module,
+        'Tag',
+        SimpleNamespace(
+            query=DummyQuery(),
+            id=app_module.Tag.id,
+            name=app_module.Tag.name,
+            posts=app_module.Tag.posts,
+        ),
+    )
+    monkeypatch.setattr(app_module, '_tag_vocabulary', None)
 
     with app.app_context():
         html, _ = render_markdown('(foo(x_{1},x_{2})=a x_{1}+b x_{2}) and foo', enable_mathjax=True)
@@ -48,3 +48,33 @@ def test_synonym_search(client):
     resp = client.get('/search', query_string={'tags': 'car'})
     text = resp.get_data(as_text=True)
     assert 'Vehicle' in text
+
+
+def test_synonyms_stored_on_tag(client, monkeypatch):
+    import app as app_module
+
+    monkeypatch.setattr(
+        app_module, 'wordnet_synonyms', lambda name: frozenset({name, 'rock'})
+    )
+    with app.app_context():
+        (tag,) = app_module.get_or_create_tags(['stone'])
+        db.session.commit()
+        assert tag.synonyms == '["rock", "stone"]'
+        monkeypatch.setattr(app_module, 'wordnet_synonyms', lambda name: None)
+        assert app_module.get_tag_synonyms('Stone') == {'rock', 'stone'}
+
+
+def test_backfill_tag_synonyms_command(client, monkeypatch):
+    import app as app_module
+
+    with app.app_context():
+        db.session.execute(text("UPDATE tag SET synonyms = NULL"))
+        db.session.commit()
+    monkeypatch.setattr(
+        app_module, 'wordnet_synonyms', lambda name: frozenset({name, 'car'})
+    )
+    result = app.test_cli_runner().invoke(args=['backfill-tag-synonyms'])
+    assert result.exit_code == 0
+    assert 'Updated 1 tags.' in result.output
+    with app.app_context():
+        assert Tag.query.first().synonyms == '["automobile", "car"]'
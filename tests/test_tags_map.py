@@ -41,7 +41,7 @@ def test_tags_page_includes_locations_and_post_links(client):
     resp = client.get('/tags')
     data = resp.get_data(as_text=True)
     assert 'tagLocations' in data
-    assert '"lat": 10.0' in data
+    assert '"lat":10.0' in data
     assert '/tag/t1' in data
     assert '/en/p1' in data
 
@@ -69,7 +69,7 @@ def test_tags_page_uses_metadata_for_locations(client):
         db.session.commit()
     resp = client.get('/tags')
     data = resp.get_data(as_text=True)
-    assert '"lat": 30.0' in data
+    assert '"lat":30.0' in data
     assert '/tag/t2' in data
 
 
@@ -223,3 +223,14 @@ def test_tag_preview_prioritizes_nearby_high_views(client):
     titles = [p['title'] for p in t3['posts']]
     assert titles == ['NearHigh', 'NearLow', 'Base', 'FarHigh']
 
+
+def test_haversine_km_matches_without_numpy(monkeypatch):
+    import app as app_module
+
+    lats, lons = [0.0, 51.5, -33.9], [0.0, -0.13, 151.2]
+    vectorized = app_module.haversine_km(48.85, 2.35, lats, lons)
+    monkeypatch.setattr(app_module, 'np', None)
+    scalar = app_module.haversine_km(48.85, 2.35, lats, lons)
+    assert vectorized == pytest.approx(scalar)
+    assert vectorized[1] == pytest.approx(343.5, abs=1)
+    assert app_module.haversine_km(0, 0, [], []) == []
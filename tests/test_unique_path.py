@@ -57,3 +57,23 @@ def test_unique_path_generated_for_blank_path(client):
         assert len(posts) == 2
         assert posts[0].path == 'hello-world'
         assert posts[1].path == 'hello-world-1'
+
+
+def test_slugify_transliterates_accents():
+    from app import _slugify
+
+    assert _slugify('  Café -- Noir!  ') == 'cafe-noir'
+    assert _slugify('東京') == 'post'
+
+
+def test_path_taken_excludes_own_post(client):
+    from app import path_taken
+
+    with app.app_context():
+        user = User.query.first()
+        post = Post(title='T', body='B', path='taken', language='en', author=user)
+        db.session.add(post)
+        db.session.commit()
+        assert path_taken('taken', 'en')
+        assert not path_taken('taken', 'es')
+        assert not path_taken('taken', 'en', exclude_id=post.id)
@@ -4,6 +4,8 @@ import sys
 import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from datetime import datetime, timedelta
+
 from app import app, db, User, Post, PostView
 
 
@@ -44,6 +46,27 @@ def test_view_stats_top_posts_json(client):
     assert data['daily'][0]['views'] == 1
 
 
+def test_view_stats_top_posts_windows(client):
+    now = datetime.utcnow()
+    with app.app_context():
+        user = User.query.filter_by(username='user').first()
+        post = Post.query.first()
+        other = Post(title='Old', body='B', path='old', language='en', author=user)
+        db.session.add(other)
+        db.session.flush()
+        db.session.add_all(
+            [PostView(post_id=post.id, viewed_at=now)]
+            + [PostView(post_id=other.id, viewed_at=now - timedelta(days=10)) for _ in range(3)]
+            + [PostView(post_id=other.id, viewed_at=now - timedelta(days=400))]
+        )
+        db.session.commit()
+    data = client.get('/admin/view-stats/top_posts').get_json()
+    assert data['daily'] == [{'title': 'T', 'views': 1}]
+    assert data['weekly'] == [{'title': 'T', 'views': 1}]
+    assert data['monthly'] == [{'title': 'Old', 'views': 3}, {'title': 'T', 'views': 1}]
+    assert data['yearly'] == data['monthly']
+
+
 @pytest.fixture
 def normal_client():
     app.config['TESTING'] = True